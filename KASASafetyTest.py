@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from copy import deepcopy
 from typing import Any, Dict, List
 
 from loguru import logger
@@ -23,6 +22,7 @@ from devices.KASA_Powerbar import KasaPowerbar
 
 
 SAFETY_OVERRIDE = {"target_state": "off", "timeout_minutes": 2, "enforce": True}
+MAX_CONCURRENT_OUTLETS = 8
 
 
 def _find_kasa_devices_with_safety(config: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -42,9 +42,14 @@ def _find_kasa_devices_with_safety(config: Dict[str, Any]) -> List[Dict[str, Any
 
 
 async def _prime_outlet(device_config: Dict[str, Any]) -> None:
-    config_copy = deepcopy(device_config)
-    control_block = config_copy.setdefault("control", {})
-    control_block["safety"] = dict(SAFETY_OVERRIDE)
+    # Only the control block is modified, so copy it and the outer dict and
+    # let every other key alias the loaded configuration. KasaPowerbar reads
+    # the safety block once during construction, so the override is shared.
+    control_block = {
+        **(device_config.get("control") or {}),
+        "safety": SAFETY_OVERRIDE,
+    }
+    config_copy = {**device_config, "control": control_block}
 
     kasa_device = KasaPowerbar(config_copy)
     await kasa_device.initialize()
@@ -87,14 +92,24 @@ def main() -> int:
         return 0
 
     async def runner() -> None:
-        for device in kasa_devices:
-            try:
+        # Outlets are programmed concurrently; cap the number of simultaneous
+        # connections so small home networks are not flooded.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_OUTLETS)
+
+        async def _prime_limited(device: Dict[str, Any]) -> None:
+            async with semaphore:
                 await _prime_outlet(device)
-            except Exception as exc:  # pragma: no cover - hardware interaction
+
+        results = await asyncio.gather(
+            *(_prime_limited(device) for device in kasa_devices),
+            return_exceptions=True,
+        )
+        for device, result in zip(kasa_devices, results):
+            if isinstance(result, Exception):  # pragma: no cover - hardware interaction
                 logger.error(
                     "Unable to program safety timer for device '{}': {}",
                     device.get("id"),
-                    exc,
+                    result,
                 )
 
     asyncio.run(runner())
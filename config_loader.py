@@ -4,6 +4,35 @@ from pathlib import Path
 
 from schema_validator import SchemaValidationError, validate_schema
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pragma: no cover - optional, used for large configs only
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only need
+# to handle the stdlib exception regardless of which parser is active.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Configs larger than this are stream-parsed with ijson (when installed) so the
+# raw file contents are never held in memory alongside the parsed dict.
+_STREAM_PARSE_THRESHOLD = 256 * 1024
+
+_SCHEMA_PATH = Path(__file__).with_name('docs').joinpath('configuration_schema.json')
+
+# Latest parsed schema per path with the mtime_ns it was read at, so repeated
+# loads skip re-reading and re-parsing the schema file. An edit replaces the entry.
+_SCHEMA_CACHE: dict[str, tuple[int, dict]] = {}
+
+# (mtime_ns, size, schema key) each config path last passed validation under.
+# Only the key is kept, not the config: a reload re-parses the file but skips
+# validation while neither the config nor the schema has changed.
+_VALIDATED_CONFIGS: dict[str, tuple] = {}
+
 class ConfigError(Exception):
     """Custom exception for configuration-related errors."""
     pass
@@ -21,27 +50,24 @@ def load_config(config_file_path):
     Raises:
         ConfigError: If the file is missing, invalid, or fails validation.
     """
-    if not os.path.exists(config_file_path):
-        raise ConfigError(f"Configuration file not found: {config_file_path}")
-
-    try:
-        with open(config_file_path, 'r', encoding='utf-8') as file:
-            config = json.load(file)
-    except json.JSONDecodeError as e:
-        raise ConfigError(f"Invalid JSON in configuration file: {e}")
-
-    schema_path = Path(__file__).with_name('docs').joinpath('configuration_schema.json')
     try:
-        schema_text = schema_path.read_text(encoding='utf-8')
+        file = open(config_file_path, 'rb')
     except FileNotFoundError as exc:
-        raise ConfigError(f"Configuration schema not found: {schema_path}") from exc
-    except OSError as exc:
-        raise ConfigError(f"Unable to read configuration schema: {schema_path}") from exc
+        raise ConfigError(f"Configuration file not found: {config_file_path}") from exc
 
-    try:
-        schema = json.loads(schema_text)
-    except json.JSONDecodeError as exc:
-        raise ConfigError(f"Invalid JSON in configuration schema: {exc}") from exc
+    with file:
+        schema_key, schema = _load_schema(_SCHEMA_PATH)
+        stat = os.fstat(file.fileno())
+        cache_path = str(config_file_path)
+        cache_key = (stat.st_mtime_ns, stat.st_size, schema_key)
+
+        try:
+            config = _parse_config_file(file, stat.st_size)
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"Invalid JSON in configuration file: {e}")
+
+    if _VALIDATED_CONFIGS.get(cache_path) == cache_key:
+        return config
 
     try:
         validate_schema(config, schema)
@@ -53,4 +79,76 @@ def load_config(config_file_path):
 
         raise ConfigError(f"{prefix} at {exc.location}: {exc.message}") from exc
 
+    _VALIDATED_CONFIGS[cache_path] = cache_key
     return config
+
+
+def _parse_config_file(file, size):
+    """
+    Parses an open configuration file, streaming it when it is large.
+
+    Args:
+        file (BinaryIO): The configuration file opened in binary mode.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        dict: The parsed configuration data.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    if ijson is not None and size > _STREAM_PARSE_THRESHOLD:
+        items = ijson.items(file, '', use_float=True)
+        try:
+            config = next(items)
+            # Draining the parser rejects trailing data, as json.loads does.
+            for _ in items:
+                raise ijson.JSONError("Extra data")
+            return config
+        except (ijson.JSONError, StopIteration):
+            # Re-parse with the stdlib so the error reports line and column.
+            file.seek(0)
+
+    return _json_loads(file.read())
+
+
+def _load_schema(schema_path):
+    """
+    Returns the parsed configuration schema, reusing a cached copy when the
+    file has not changed since it was last read.
+
+    Args:
+        schema_path (Path): Path to the JSON schema file.
+
+    Returns:
+        tuple: The schema's (path, mtime_ns) cache key and the parsed schema.
+
+    Raises:
+        ConfigError: If the schema is missing, unreadable, or invalid JSON.
+    """
+    try:
+        stat = os.stat(schema_path)
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Configuration schema not found: {schema_path}") from exc
+    except OSError as exc:
+        raise ConfigError(f"Unable to read configuration schema: {schema_path}") from exc
+
+    cache_key = (str(schema_path), stat.st_mtime_ns)
+    cached = _SCHEMA_CACHE.get(cache_key[0])
+    if cached is not None and cached[0] == stat.st_mtime_ns:
+        return cache_key, cached[1]
+
+    try:
+        schema_bytes = schema_path.read_bytes()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Configuration schema not found: {schema_path}") from exc
+    except OSError as exc:
+        raise ConfigError(f"Unable to read configuration schema: {schema_path}") from exc
+
+    try:
+        schema = _json_loads(schema_bytes)
+    except json.JSONDecodeError as exc:
+        raise ConfigError(f"Invalid JSON in configuration schema: {exc}") from exc
+
+    _SCHEMA_CACHE[cache_key[0]] = (stat.st_mtime_ns, schema)
+    return cache_key, schema
@@ -2,18 +2,96 @@
 
 from __future__ import annotations
 
-import datetime as _dt
+import asyncio
+import math
 import time
-from typing import Dict, Iterable, List, Mapping, Optional
+from bisect import bisect_right
+from sys import intern
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from loguru import logger
 
 from devices.power_state import PowerCommandResult
 
 
+# Normalized log level names, filled on first use of each spelling.
+_LEVEL_NAMES: Dict[str, str] = {}
+
+# Effect policy values that map to device commands; "hold"/"ignore" send nothing.
+_POLICY_COMMANDS: Dict[str, str] = {"on": "turn_on", "off": "turn_off"}
+
+
+@dataclass(slots=True)
+class _ScheduleDef:
+    """Schedule with its time range parsed into seconds of day."""
+
+    id: str
+    has_time_range: bool
+    window: Optional[Tuple[int, int]]  # None when time_range is invalid
+    targets: Mapping[str, object]
+    state_targets: Mapping[str, str]  # string targets, stripped and lower-cased
+    bounds: Mapping[str, Tuple[float, float]]  # range targets; missing limits are +/-inf
+
+
+@dataclass(slots=True)
+class _PropertyPlan:
+    """Config-derived inputs needed to evaluate one environment property."""
+
+    environment_id: str
+    property_name: str
+    schedules: Tuple[_ScheduleDef, ...]  # in configured order, targeting this property
+    sensor_ids: Tuple[str, ...]
+    controllers: Tuple[str, ...]
+    status_slot: int  # index into the per-(environment, property) tracking lists
+    command_slots: Tuple[int, ...]  # index into _last_commands, per controller
+
+
+@dataclass(slots=True)
+class _DeviceDef:
+    """Device definition with its effects resolved against the defaults."""
+
+    id: str
+    what: Optional[str]
+    effects: Tuple[Mapping[str, object], ...]
+
+
 class EnvironmentController:
     """Decide how actuators should respond to current sensor readings."""
 
+    __slots__ = (
+        "environments",
+        "schedules",
+        "device_definitions",
+        "device_effect_defaults",
+        "debounce_seconds",
+        "state_refresh_seconds",
+        "dry_run",
+        "_schedule_defs",
+        "_device_defs",
+        "_debounce_ns",
+        "_state_refresh_ns",
+        "_repeat_quiet_ns",
+        "_log_callback",
+        "_bound_loggers",
+        "_debug_enabled",
+        "_commanded_states",
+        "_property_effects",
+        "_bound_commands",
+        "_status_slots",
+        "_command_slots",
+        "_last_commands",
+        "_last_property_logs",
+        "_missing_reading_logs",
+        "_plan",
+        "_sensor_ids",
+        "_last_pass_inputs",
+        "_skip_until_ns",
+        "_schedule_boundaries",
+        "_active_schedules",
+        "_active_span",
+    )
+
     def __init__(
         self,
         *,
@@ -22,6 +100,7 @@ class EnvironmentController:
         debounce_seconds: float = 5.0,
         state_refresh_seconds: float = 60.0,
         dry_run: bool = False,
+        min_log_level: str = "DEBUG",
     ) -> None:
         self.environments = config["environments"]["definitions"]
         self.schedules = {
@@ -34,14 +113,95 @@ class EnvironmentController:
         self.device_effect_defaults = (
             config["devices"].get("defaults", {}).get("effects", {})
         )
+        self._schedule_defs: Dict[str, _ScheduleDef] = {
+            schedule_id: _ScheduleDef(
+                id=schedule_id,
+                has_time_range=bool(schedule.get("time_range")),
+                window=(
+                    _parse_time_range(schedule["time_range"])
+                    if schedule.get("time_range")
+                    else None
+                ),
+                targets=schedule.get("targets", {}),
+                state_targets={
+                    property_name: target.strip().lower()
+                    for property_name, target in schedule.get("targets", {}).items()
+                    if isinstance(target, str)
+                },
+                bounds={
+                    property_name: _target_bounds(target)
+                    for property_name, target in schedule.get("targets", {}).items()
+                    if isinstance(target, Mapping)
+                },
+            )
+            for schedule_id, schedule in self.schedules.items()
+        }
+        # Config-derived ids are interned so the tuple keys built from them in the
+        # tracking dicts compare by identity on every tick.
+        self._device_defs: Dict[str, _DeviceDef] = {
+            intern(device_id): _DeviceDef(
+                id=intern(device_id),
+                what=definition.get("what"),
+                effects=tuple(
+                    definition.get("effects")
+                    or self.device_effect_defaults.get(definition.get("what"))
+                    or ()
+                ),
+            )
+            for device_id, definition in self.device_definitions.items()
+        }
         self.debounce_seconds = debounce_seconds
         self.state_refresh_seconds = state_refresh_seconds
+        # Integer nanosecond thresholds for comparisons against time.monotonic_ns().
+        self._debounce_ns = int(debounce_seconds * 1e9)
+        self._state_refresh_ns = int(state_refresh_seconds * 1e9)
+        # A repeat of the last command is skipped until both windows have passed.
+        self._repeat_quiet_ns = max(self._debounce_ns, self._state_refresh_ns)
         self.dry_run = dry_run
         self._log_callback = log_callback
-        self._last_commands: Dict[tuple[str, str], tuple[str, float]] = {}
-        self._last_property_logs: Dict[tuple[str, str], tuple[float, str, object, object]] = {}
-        self._missing_reading_logs: Dict[tuple[str, str], float] = {}
-        self._commanded_states: Dict[str, tuple[bool, float]] = {}  # device_id -> (desired_state, timestamp)
+        self._bound_loggers: Dict[str, Any] = {}  # entity -> bound loguru logger
+        # Skip formatting DEBUG messages that the configured sinks would drop.
+        self._debug_enabled = (
+            logger.level(min_log_level.upper()).no <= logger.level("DEBUG").no
+        )
+        self._commanded_states: Dict[str, tuple[bool, int]] = {}  # device_id -> (desired_state, monotonic_ns)
+        # (device_id, property_name) -> decision->command table per effect on that
+        # property, or None when the device declares no effects at all. Built in
+        # one pass over the device effects; other pairs are filled in on lookup.
+        self._property_effects: Dict[tuple[str, str], Optional[Tuple[Dict[str, Optional[str]], ...]]] = (
+            self._index_property_effects()
+        )
+        # (device_id, method) -> (device, bound method or None if unsupported)
+        self._bound_commands: Dict[tuple[str, str], tuple[object, Optional[Callable]]] = {}
+        # (environment_id, property_name) and (device_id, property_name) pairs are
+        # fixed by the config, so their tracking state lives in lists indexed by
+        # slots assigned while building the plan.
+        self._status_slots: Dict[tuple[str, str], int] = {}
+        self._command_slots: Dict[tuple[str, str], int] = {}
+        self._last_commands: List[tuple[Optional[str], int]] = []  # (command, monotonic_ns)
+        self._last_property_logs: List[Optional[tuple[int, str, object, object]]] = []
+        self._missing_reading_logs: List[Optional[int]] = []
+        self._plan: List[_PropertyPlan] = self._build_plan()
+        self._sensor_ids: Tuple[str, ...] = tuple(
+            dict.fromkeys(sensor_id for entry in self._plan for sensor_id in entry.sensor_ids)
+        )
+        # Readings and schedule minute seen by the last full pass; an identical
+        # tick inside the debounce window is skipped (see evaluate).
+        self._last_pass_inputs: Optional[tuple[int, tuple]] = None
+        self._skip_until_ns = 0
+        # Seconds of day at which some schedule window opens or closes; the
+        # active schedule per plan entry only changes when one is crossed.
+        self._schedule_boundaries: List[int] = sorted(
+            {0}
+            | {
+                boundary
+                for schedule in self._schedule_defs.values()
+                if schedule.window is not None
+                for boundary in (schedule.window[0], schedule.window[1] + 1)
+            }
+        )
+        self._active_schedules: List[Optional[_ScheduleDef]] = []
+        self._active_span: Tuple[int, int] = (0, -1)  # [start, end) seconds of day
 
     # ------------------------------------------------------------------
     # Public API
@@ -57,97 +217,115 @@ class EnvironmentController:
         # Verify commanded states from previous cycle
         await self._verify_commanded_states(devices)
 
-        for environment in self.environments:
-            environment_id = environment["id"]
-            properties = environment["properties"]
+        now_seconds = _seconds_of_day()
+        now_ns = time.monotonic_ns()  # shared by every debounce check this tick
+        span_start = self._refresh_active_schedules(now_seconds)
+        # The same readings under the same active schedules produce the same
+        # decisions; inside the debounce window those commands would be
+        # suppressed anyway. _issue_command clears _last_pass_inputs when a
+        # command is not recorded, so failed or no-op commands retry next tick.
+        pass_inputs = self._sensor_snapshot(sensor_data, span_start)
+        if pass_inputs == self._last_pass_inputs and now_ns < self._skip_until_ns:
+            return
 
-            for property_name, property_config in properties.items():
-                schedule = self._select_schedule(
-                    property_name, property_config["schedules"]
+        self._last_pass_inputs = pass_inputs
+        self._skip_until_ns = now_ns + self._debounce_ns
+        pending: List[tuple[str, Awaitable[bool]]] = []
+
+        for entry, schedule in zip(self._plan, self._active_schedules):
+            environment_id = entry.environment_id
+            property_name = entry.property_name
+
+            if not schedule:
+                self._log(
+                    f"No active schedule found for property '{property_name}'",
+                    level="INFO",
+                    entity=environment_id,
                 )
-                if not schedule:
-                    self._log(
-                        f"No active schedule found for property '{property_name}'",
-                        level="INFO",
-                        entity=environment_id,
-                    )
-                    continue
+                continue
+
+            target_range = schedule.targets.get(property_name)
+            if target_range is None:
+                self._log(
+                    f"Schedule '{schedule.id}' missing targets for '{property_name}'",
+                    level="WARNING",
+                    entity=environment_id,
+                )
+                continue
 
-                target_range = schedule["targets"].get(property_name)
-                if target_range is None:
+            if isinstance(target_range, str):
+                desired_state = schedule.state_targets[property_name]
+                if desired_state not in {"on", "off"}:
                     self._log(
-                        f"Schedule '{schedule['id']}' missing targets for '{property_name}'",
+                        f"Unsupported target '{target_range}' for property '{property_name}'",
                         level="WARNING",
                         entity=environment_id,
                     )
                     continue
 
-                if isinstance(target_range, str):
-                    desired_state = target_range.strip().lower()
-                    if desired_state not in {"on", "off"}:
-                        self._log(
-                            f"Unsupported target '{target_range}' for property '{property_name}'",
-                            level="WARNING",
-                            entity=environment_id,
-                        )
-                        continue
-
-                    await self._apply_state_targets(
-                        environment_id=environment_id,
-                        property_name=property_name,
-                        desired_state=desired_state,
-                        controllers=property_config["controllers"],
-                        devices=devices,
-                    )
-                    continue
-
-                property_value = self._aggregate_sensor_values(
-                    property_name, property_config["sensors"], sensor_data
+                await self._apply_state_targets(
+                    environment_id=environment_id,
+                    property_name=property_name,
+                    desired_state=desired_state,
+                    controllers=entry.controllers,
+                    command_slots=entry.command_slots,
+                    devices=devices,
+                    now=now_ns,
+                    pending=pending,
                 )
+                continue
 
-                if property_value is None:
-                    missing_key = (environment_id, property_name)
-                    now = time.monotonic()
-                    last_missing = self._missing_reading_logs.get(missing_key)
-
-                    if last_missing is None or now - last_missing >= self.state_refresh_seconds:
-                        self._log(
-                            f"No readings available for property '{property_name}'",
-                            level="WARNING",
-                            entity=environment_id,
-                        )
-                        self._missing_reading_logs[missing_key] = now
-
-                    continue
-
-                self._missing_reading_logs.pop((environment_id, property_name), None)
+            property_value = self._aggregate_sensor_values(
+                property_name, entry.sensor_ids, sensor_data
+            )
 
-                decision = self._decision(property_value, target_range)
+            status_slot = entry.status_slot
+            if property_value is None:
+                last_missing = self._missing_reading_logs[status_slot]
 
-                if self._should_log_property_status(
-                    environment_id=environment_id,
-                    property_name=property_name,
-                    property_value=property_value,
-                    target_range=target_range,
-                    decision=decision,
-                ):
+                if last_missing is None or now_ns - last_missing >= self._state_refresh_ns:
                     self._log(
-                        f"{property_name} is {property_value}; "
-                        f"target min={target_range.get('min')} max={target_range.get('max')} -> {decision}",
-                        level="INFO",
+                        f"No readings available for property '{property_name}'",
+                        level="WARNING",
                         entity=environment_id,
                     )
+                    self._missing_reading_logs[status_slot] = now_ns
 
-                await self._apply_device_commands(
-                    environment_id=environment_id,
-                    property_name=property_name,
-                    decision=decision,
-                    controllers=property_config["controllers"],
-                    devices=devices,
-                    target_range=target_range,
-                    property_value=property_value,
+                continue
+
+            self._missing_reading_logs[status_slot] = None
+
+            minimum, maximum = schedule.bounds[property_name]
+            decision = _decision(property_value, minimum, maximum)
+
+            if self._should_log_property_status(
+                status_slot=status_slot,
+                property_value=property_value,
+                target_range=target_range,
+                decision=decision,
+            ):
+                self._log(
+                    f"{property_name} is {property_value}; "
+                    f"target min={target_range.get('min')} max={target_range.get('max')} -> {decision}",
+                    level="INFO",
+                    entity=environment_id,
                 )
 
+            await self._apply_device_commands(
+                environment_id=environment_id,
+                property_name=property_name,
+                decision=decision,
+                controllers=entry.controllers,
+                command_slots=entry.command_slots,
+                devices=devices,
+                target_range=target_range,
+                property_value=property_value,
+                now=now_ns,
+                pending=pending,
+            )
+
+        await self._dispatch_commands(pending)
+
     # ------------------------------------------------------------------
     # Decision helpers
     # ------------------------------------------------------------------
@@ -159,13 +337,15 @@ class EnvironmentController:
     ) -> Optional[float]:
         """Return the average reading for a property across available sensors."""
 
-        values: List[float] = []
+        total = 0.0
+        count = 0
+        get_reading = sensor_data.get
 
         for sensor_id in sensors:
-            if sensor_id not in sensor_data:
+            reading = get_reading(sensor_id)
+            if reading is None:
                 continue
 
-            reading = sensor_data.get(sensor_id)
             if isinstance(reading, dict):
                 reading_value = reading.get(property_name)
             else:
@@ -174,50 +354,74 @@ class EnvironmentController:
             if reading_value is None:
                 continue
 
+            if type(reading_value) is float:  # common case; skip float() and try
+                total += reading_value
+                count += 1
+                continue
+
             try:
-                values.append(float(reading_value))
+                total += float(reading_value)
             except (TypeError, ValueError):
                 self._log(
                     f"Sensor '{sensor_id}' returned non-numeric value for '{property_name}': {reading_value}",
                     level="WARNING",
                     entity=property_name,
                 )
+            else:
+                count += 1
 
-        if not values:
+        if not count:
             return None
 
-        return sum(values) / len(values)
-
-    def _select_schedule(self, property_name: str, schedule_ids: Iterable[str]):
-        """Choose the first active schedule for a property based on time range."""
+        return total / count
 
-        now = _dt.datetime.now().time()
-        for schedule_id in schedule_ids:
-            schedule = self.schedules.get(schedule_id)
-            if not schedule:
-                continue
+    def _sensor_snapshot(
+        self, sensor_data: Mapping[str, object], span_start: int
+    ) -> tuple[int, tuple]:
+        """Return a comparable snapshot of the readings this controller uses."""
 
-            time_range = schedule.get("time_range")
-            if time_range and not _time_in_range(time_range, now):
-                continue
+        readings = []
+        for sensor_id in self._sensor_ids:
+            reading = sensor_data.get(sensor_id)
+            if isinstance(reading, dict):
+                reading = tuple(reading.items())
+            readings.append(reading)
+
+        return (span_start, tuple(readings))
+
+    def _refresh_active_schedules(self, now_seconds: int) -> int:
+        """Select each plan entry's schedule, reusing the selection until a boundary.
+
+        Returns the start of the span of the day the current selection holds for.
+        """
+
+        start, end = self._active_span
+        if start <= now_seconds < end:
+            return start
+
+        boundaries = self._schedule_boundaries
+        index = bisect_right(boundaries, now_seconds)
+        start = boundaries[index - 1]
+        end = boundaries[index] if index < len(boundaries) else 24 * 3600
+        self._active_schedules = [
+            self._select_schedule(entry.schedules, now_seconds) for entry in self._plan
+        ]
+        self._active_span = (start, end)
+        return start
+
+    def _select_schedule(
+        self, schedules: Iterable[_ScheduleDef], now_seconds: int
+    ) -> Optional[_ScheduleDef]:
+        """Choose the first active schedule for a property based on time range."""
 
-            if property_name not in schedule.get("targets", {}):
+        for schedule in schedules:
+            if schedule.has_time_range and not _time_in_range(schedule.window, now_seconds):
                 continue
 
             return schedule
 
         return None
 
-    def _decision(self, value: float, target_range: Mapping[str, object]) -> str:
-        minimum = target_range.get("min")
-        maximum = target_range.get("max")
-
-        if minimum is not None and value < minimum:
-            return "increase"
-        if maximum is not None and value > maximum:
-            return "decrease"
-        return "stable"
-
     # ------------------------------------------------------------------
     # Command execution
     # ------------------------------------------------------------------
@@ -231,8 +435,8 @@ class EnvironmentController:
             if not device:
                 continue
 
-            is_on_fn = getattr(device, "is_on", None)
-            if not callable(is_on_fn):
+            is_on_fn = self._device_method(device_id, device, "is_on")
+            if is_on_fn is None:
                 continue
 
             try:
@@ -259,6 +463,34 @@ class EnvironmentController:
                 # State matches, clear tracking
                 del self._commanded_states[device_id]
 
+    async def _dispatch_commands(self, pending: List[tuple[str, Awaitable[bool]]]) -> None:
+        """Run queued commands concurrently across devices, in order per device."""
+
+        if not pending:
+            return
+
+        by_device: Dict[str, List[Awaitable[bool]]] = {}
+        for device_id, command_call in pending:
+            by_device.setdefault(device_id, []).append(command_call)
+
+        async def _run_in_order(command_calls: List[Awaitable[bool]]) -> None:
+            for command_call in command_calls:
+                await command_call
+
+        device_ids = list(by_device)
+        results = await asyncio.gather(
+            *(_run_in_order(by_device[device_id]) for device_id in device_ids),
+            return_exceptions=True,
+        )
+
+        for device_id, result in zip(device_ids, results):
+            if isinstance(result, BaseException):
+                self._log(
+                    f"Command dispatch failed for '{device_id}': {result}",
+                    level="ERROR",
+                    entity="controller",
+                )
+
     async def _apply_state_targets(
         self,
         *,
@@ -267,25 +499,31 @@ class EnvironmentController:
         desired_state: str,
         controllers: Iterable[str],
         devices: Mapping[str, object],
+        command_slots: Optional[Iterable[int]] = None,
+        now: Optional[int] = None,
+        pending: Optional[List[tuple[str, Awaitable[bool]]]] = None,
     ) -> None:
         command = "turn_on" if desired_state == "on" else "turn_off"
+        if command_slots is None:
+            command_slots = [self._command_slot(device_id, property_name) for device_id in controllers]
+        if now is None:
+            now = time.monotonic_ns()
 
-        for device_id in controllers:
-            history_key = (device_id, property_name)
-            last_action, last_time = self._last_commands.get(history_key, (None, 0))
-            now = time.monotonic()
+        for device_id, command_slot in zip(controllers, command_slots):
+            last_action, last_time = self._last_commands[command_slot]
 
-            if last_action == command and now - last_time < self.state_refresh_seconds:
-                self._log(
-                    f"No state change for '{device_id}' controlling '{property_name}'; "
-                    f"last {command} sent {now - last_time:.1f}s ago",
-                    level="DEBUG",
-                    entity=environment_id,
-                )
+            if last_action == command and now - last_time < self._state_refresh_ns:
+                if self._debug_enabled:
+                    self._log(
+                        f"No state change for '{device_id}' controlling '{property_name}'; "
+                        f"last {command} sent {(now - last_time) / 1e9:.1f}s ago",
+                        level="DEBUG",
+                        entity=environment_id,
+                    )
                 continue
 
-            device_effects = self._device_effects(device_id)
-            if not device_effects:
+            property_effects = self._effects_for_property(device_id, property_name)
+            if property_effects is None:
                 self._log(
                     f"No effects declared for device '{device_id}' controlling '{property_name}'",
                     level="WARNING",
@@ -293,19 +531,22 @@ class EnvironmentController:
                 )
                 continue
 
-            for effect in device_effects:
-                if effect.get("property") != property_name:
-                    continue
-
-                await self._issue_command(
+            for _effect in property_effects:
+                command_call = self._issue_command(
                     device_id=device_id,
+                    command_slot=command_slot,
                     devices=devices,
                     command=command,
                     environment_id=environment_id,
                     property_name=property_name,
                     property_value=desired_state,
                     target_range={"state": desired_state},
+                    now=now,
                 )
+                if pending is None:
+                    await command_call
+                else:
+                    pending.append((device_id, command_call))
 
     async def _apply_device_commands(
         self,
@@ -317,10 +558,17 @@ class EnvironmentController:
         devices: Mapping[str, object],
         target_range: Mapping[str, object],
         property_value: float,
+        command_slots: Optional[Iterable[int]] = None,
+        now: Optional[int] = None,
+        pending: Optional[List[tuple[str, Awaitable[bool]]]] = None,
     ) -> None:
-        for device_id in controllers:
-            device_effects = self._device_effects(device_id)
-            if not device_effects:
+        if now is None:
+            now = time.monotonic_ns()
+        if command_slots is None:
+            command_slots = [self._command_slot(device_id, property_name) for device_id in controllers]
+        for device_id, command_slot in zip(controllers, command_slots):
+            property_effects = self._effects_for_property(device_id, property_name)
+            if property_effects is None:
                 self._log(
                     f"No effects declared for device '{device_id}' controlling '{property_name}'",
                     level="WARNING",
@@ -328,68 +576,67 @@ class EnvironmentController:
                 )
                 continue
 
-            for effect in device_effects:
-                if effect.get("property") != property_name:
-                    continue
-
-                command = self._determine_command(decision, effect)
+            for effect_commands in property_effects:
+                command = effect_commands[decision]
                 if not command:
                     continue
 
-                await self._issue_command(
+                if not self._debug_enabled:
+                    # _issue_command would skip this repeat; avoid queueing it at all.
+                    last_action, last_time = self._last_commands[command_slot]
+                    if last_action == command and now - last_time < self._repeat_quiet_ns:
+                        continue
+
+                command_call = self._issue_command(
                     device_id=device_id,
+                    command_slot=command_slot,
                     devices=devices,
                     command=command,
                     environment_id=environment_id,
                     property_name=property_name,
                     property_value=property_value,
                     target_range=target_range,
+                    now=now,
                 )
-
-    def _determine_command(self, decision: str, effect: Mapping[str, object]) -> Optional[str]:
-        """Convert decision to device command using effect policy."""
-        policy = effect["policy"]
-        desired = str(policy[decision]).lower()
-
-        if desired == "on":
-            return "turn_on"
-        if desired == "off":
-            return "turn_off"
-
-        return None
+                if pending is None:
+                    await command_call
+                else:
+                    pending.append((device_id, command_call))
 
     async def _issue_command(
         self,
         *,
         device_id: str,
+        command_slot: int,
         devices: Mapping[str, object],
         command: str,
         environment_id: str,
         property_name: str,
         property_value: float,
         target_range: Mapping[str, object],
+        now: int,
     ) -> bool:
-        now = time.monotonic()
-        history_key = (device_id, property_name)
-        last_action, last_time = self._last_commands.get(history_key, (None, 0))
+        last_action, last_time = self._last_commands[command_slot]
 
         if last_action == command:
-            if now - last_time < self.debounce_seconds:
-                self._log(
-                    f"Skipping {command} for '{device_id}' controlling '{property_name}' "
-                    f"due to debounce window ({self.debounce_seconds}s)",
-                    level="DEBUG",
-                    entity=environment_id,
-                )
+            if now - last_time < self._debounce_ns:
+                if self._debug_enabled:
+                    self._log(
+                        f"Skipping {command} for '{device_id}' controlling '{property_name}' "
+                        f"due to debounce window ({self.debounce_seconds}s)",
+                        level="DEBUG",
+                        entity=environment_id,
+                    )
                 return False
 
-            if now - last_time < self.state_refresh_seconds:
-                self._log(
-                    f"No state change for '{device_id}' controlling '{property_name}'; "
-                    f"last {command} sent {now - last_time:.1f}s ago",
-                    level="DEBUG",
-                    entity=environment_id,
-                )
+            if now - last_time < self._state_refresh_ns:
+                if self._debug_enabled:
+                    self._log(
+                        f"No state change for '{device_id}' controlling '{property_name}'; "
+                        f"last {command} sent {(now - last_time) / 1e9:.1f}s ago",
+                        level="DEBUG",
+                        entity=environment_id,
+                    )
                 return False
 
         device = devices.get(device_id)
@@ -399,26 +646,23 @@ class EnvironmentController:
                 level="ERROR",
                 entity=environment_id,
             )
+            self._last_pass_inputs = None
             return False
 
-        command_fn = getattr(device, command, None)
-        if not callable(command_fn):
+        command_fn = self._device_method(device_id, device, command)
+        if command_fn is None:
             self._log(
                 f"Device '{device_id}' does not implement '{command}'.",
                 level="ERROR",
                 entity=environment_id,
             )
+            self._last_pass_inputs = None
             return False
 
-        summary = (
-            f"{command} {device_id} for {property_name} "
-            f"(value={property_value}, target={target_range})"
-        )
-        desired_state_label = "on" if command == "turn_on" else "off"
-
         if self.dry_run:
+            summary = _command_summary(command, device_id, property_name, property_value, target_range)
             self._log(f"[dry-run] Would {summary}", level="INFO", entity=environment_id)
-            self._last_commands[history_key] = (command, now)
+            self._last_commands[command_slot] = (command, now)
             return True
 
         try:
@@ -431,17 +675,22 @@ class EnvironmentController:
                 command_sent = bool(getattr(result, "command_sent"))
 
             if command_sent:
+                summary = _command_summary(command, device_id, property_name, property_value, target_range)
                 self._log(summary, level="INFO", entity=environment_id)
-                self._last_commands[history_key] = (command, now)
+                self._last_commands[command_slot] = (command, now)
                 # Track for deferred verification
                 desired_state = command == "turn_on"
                 self._commanded_states[device_id] = (desired_state, now)
             else:
-                self._log(
-                    f"No-op: {device_id} already {desired_state_label} for '{property_name}'",
-                    level="DEBUG",
-                    entity=environment_id,
-                )
+                # Nothing was recorded, so an identical next tick must re-evaluate.
+                self._last_pass_inputs = None
+                if self._debug_enabled:
+                    desired_state_label = "on" if command == "turn_on" else "off"
+                    self._log(
+                        f"No-op: {device_id} already {desired_state_label} for '{property_name}'",
+                        level="DEBUG",
+                        entity=environment_id,
+                    )
 
             return command_sent
 
@@ -451,47 +700,146 @@ class EnvironmentController:
                 level="ERROR",
                 entity=environment_id,
             )
+            self._last_pass_inputs = None
             return False
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _device_effects(self, device_id: str) -> List[Mapping[str, object]]:
-        definition = self.device_definitions.get(device_id)
-        if not definition:
-            return []
+    def _device_effects(self, device_id: str) -> Tuple[Mapping[str, object], ...]:
+        definition = self._device_defs.get(device_id)
+        if definition is None:
+            return ()
 
-        effects = definition.get("effects") or []
-        if effects:
-            return list(effects)
+        return definition.effects
 
-        default_effects = self.device_effect_defaults.get(definition.get("what"), [])
-        return list(default_effects) if default_effects else []
+    def _device_method(self, device_id: str, device: object, name: str) -> Optional[Callable]:
+        """Return the device's bound method *name*, resolving it once per device."""
+
+        key = (device_id, name)
+        cached = self._bound_commands.get(key)
+        if cached is not None and cached[0] is device:
+            return cached[1]
+
+        method = getattr(device, name, None)
+        if not callable(method):
+            method = None
+
+        self._bound_commands[key] = (device, method)
+        return method
+
+    def _effects_for_property(
+        self, device_id: str, property_name: str
+    ) -> Optional[Tuple[Dict[str, Optional[str]], ...]]:
+        """Return command tables for the device's effects on a property.
+
+        Returns None if the device declares no effects at all.
+        """
+
+        key = (device_id, property_name)
+        if key in self._property_effects:
+            return self._property_effects[key]
+
+        # Not in the index: the device has no effect on this property.
+        effects = () if self._device_effects(device_id) else None
+        self._property_effects[key] = effects
+        return effects
+
+    def _index_property_effects(
+        self,
+    ) -> Dict[tuple[str, str], Optional[Tuple[Dict[str, Optional[str]], ...]]]:
+        """Group every device's effect command tables by (device_id, property)."""
+
+        index: Dict[tuple[str, str], List[Dict[str, Optional[str]]]] = {}
+        for device_id, definition in self._device_defs.items():
+            for effect in definition.effects:
+                index.setdefault((device_id, effect.get("property")), []).append(
+                    _effect_commands(effect)
+                )
+
+        return {key: tuple(tables) for key, tables in index.items()}
+
+    def _build_plan(self) -> List[_PropertyPlan]:
+        """Flatten environment properties and resolve their controller effects once."""
+
+        plan: List[_PropertyPlan] = []
+        for environment in self.environments:
+            environment_id = intern(environment["id"])
+            for property_name, property_config in environment["properties"].items():
+                property_name = intern(property_name)
+                controllers = tuple(
+                    intern(device_id) for device_id in property_config["controllers"]
+                )
+                for device_id in controllers:
+                    self._effects_for_property(device_id, property_name)
+
+                plan.append(
+                    _PropertyPlan(
+                        environment_id=environment_id,
+                        property_name=property_name,
+                        schedules=tuple(
+                            self._schedule_defs[schedule_id]
+                            for schedule_id in property_config["schedules"]
+                            if schedule_id in self._schedule_defs
+                            and property_name in self._schedule_defs[schedule_id].targets
+                        ),
+                        sensor_ids=tuple(
+                            intern(sensor_id) for sensor_id in property_config.get("sensors", ())
+                        ),
+                        controllers=controllers,
+                        status_slot=self._status_slot(environment_id, property_name),
+                        command_slots=tuple(
+                            self._command_slot(device_id, property_name)
+                            for device_id in controllers
+                        ),
+                    )
+                )
+
+        return plan
+
+    def _status_slot(self, environment_id: str, property_name: str) -> int:
+        """Return the tracking slot for an environment property, allocating it once."""
+
+        key = (environment_id, property_name)
+        slot = self._status_slots.get(key)
+        if slot is None:
+            slot = self._status_slots[key] = len(self._last_property_logs)
+            self._last_property_logs.append(None)
+            self._missing_reading_logs.append(None)
+        return slot
+
+    def _command_slot(self, device_id: str, property_name: str) -> int:
+        """Return the _last_commands slot for a device property, allocating it once."""
+
+        key = (device_id, property_name)
+        slot = self._command_slots.get(key)
+        if slot is None:
+            slot = self._command_slots[key] = len(self._last_commands)
+            self._last_commands.append((None, 0))
+        return slot
 
     def _should_log_property_status(
         self,
         *,
-        environment_id: str,
-        property_name: str,
+        status_slot: int,
         property_value: float,
         target_range: Mapping[str, object],
         decision: str,
     ) -> bool:
         """Only log property status when the value or decision changes."""
 
-        status_key = (environment_id, property_name)
-        rounded_value = round(property_value, 2)
+        # Compare in integer hundredths; round(x, 2) is much slower than round(x).
         status = (
-            rounded_value,
+            round(property_value * 100),
             decision,
             target_range.get("min"),
             target_range.get("max"),
         )
 
-        if self._last_property_logs.get(status_key) == status:
+        if self._last_property_logs[status_slot] == status:
             return False
 
-        self._last_property_logs[status_key] = status
+        self._last_property_logs[status_slot] = status
         return True
 
     def _log(self, message: str, *, level: str = "INFO", entity: str = "controller") -> None:
@@ -504,26 +852,90 @@ class EnvironmentController:
             )
             return
 
-        logger.bind(COMPONENT_TYPE="controller", ENTITY_NAME=entity).log(level.upper(), message)
+        bound_logger = self._bound_loggers.get(entity)
+        if bound_logger is None:
+            bound_logger = logger.bind(COMPONENT_TYPE="controller", ENTITY_NAME=entity)
+            self._bound_loggers[entity] = bound_logger
+
+        level_name = _LEVEL_NAMES.get(level)
+        if level_name is None:
+            level_name = _LEVEL_NAMES[level] = level.upper()
+
+        bound_logger.log(level_name, message)
+
+
+def _target_bounds(target_range: Mapping[str, object]) -> Tuple[float, float]:
+    """Return (min, max) for a range target, using infinities for missing limits."""
+    minimum = target_range.get("min")
+    maximum = target_range.get("max")
+    return (
+        -math.inf if minimum is None else minimum,
+        math.inf if maximum is None else maximum,
+    )
+
+
+def _decision(value: float, minimum: float, maximum: float) -> str:
+    if value < minimum:
+        return "increase"
+    if value > maximum:
+        return "decrease"
+    return "stable"
 
 
-def _time_in_range(range_definition: str, now: _dt.time) -> bool:
-    """Return True if the current time is within a HH:MM-HH:MM window."""
+def _effect_commands(effect: Mapping[str, object]) -> Dict[str, Optional[str]]:
+    """Map each decision in an effect's policy to its device command (or None)."""
+    return {
+        decision: _POLICY_COMMANDS.get(str(policy).lower())
+        for decision, policy in effect["policy"].items()
+    }
+
+
+def _command_summary(
+    command: str,
+    device_id: str,
+    property_name: str,
+    property_value: object,
+    target_range: Mapping[str, object],
+) -> str:
+    return (
+        f"{command} {device_id} for {property_name} "
+        f"(value={property_value}, target={target_range})"
+    )
+
+
+def _seconds_of_day() -> int:
+    """Return the current local time as seconds since midnight."""
+
+    now = time.localtime()
+    return now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
+
+
+def _parse_time_range(range_definition: str) -> Optional[Tuple[int, int]]:
+    """Parse a HH:MM-HH:MM window into (start, end) seconds of day."""
 
     try:
         start_str, end_str = range_definition.split("-")
-        start = _to_time(start_str)
-        end = _to_time(end_str)
+        return _to_seconds(start_str), _to_seconds(end_str)
     except (ValueError, TypeError):
+        return None
+
+
+def _time_in_range(window: Optional[Tuple[int, int]], now_seconds: int) -> bool:
+    """Return True if the current time is within a parsed time window."""
+
+    if window is None:
         return False
 
+    start, end = window
     if start <= end:
-        return start <= now <= end
+        return start <= now_seconds <= end
 
     # Over-midnight window
-    return now >= start or now <= end
+    return now_seconds >= start or now_seconds <= end
 
 
-def _to_time(hhmm: str) -> _dt.time:
-    hours, minutes = hhmm.split(":")
-    return _dt.time(int(hours), int(minutes))
+def _to_seconds(hhmm: str) -> int:
+    hours, minutes = (int(part) for part in hhmm.split(":"))
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Invalid time of day: {hhmm!r}")
+    return hours * 3600 + minutes * 60
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -18,6 +20,9 @@ from devices.power_state import PowerCommandResult, ensure_power_state
 
 DEFAULT_KASA_PORT = 9999
 
+# State reads within this many seconds of a completed strip refresh reuse it.
+STRIP_UPDATE_TTL_SECONDS = 0.5
+
 
 def get_metadata() -> Dict[str, Any]:
     """Return module metadata used by dynamic documentation helpers."""
@@ -46,13 +51,50 @@ def get_metadata() -> Dict[str, Any]:
 class KasaPowerbar:
     """Interface to manage a single outlet on a TP-Link KASA smart power strip."""
 
+    __slots__ = (
+        "id",
+        "what",
+        "_log",
+        "device_name",
+        "outlet_name",
+        "_outlet_key",
+        "ip_address",
+        "port",
+        "power_rating",
+        "circuit",
+        "_safety_target_state",
+        "_safety_timeout_minutes",
+        "_safety_enforce",
+        "_safety_cached",
+        "_device",
+        "_outlet",
+        "address",
+        "_initialized",
+    )
+
     # Cache of device instances keyed by IP/name to reuse TCP sessions.
     _device_cache: Dict[str, Any] = {}
+    # Per strip cache key: (strip, lower-cased alias -> child outlet, aliases in
+    # strip order), read from the strip's children once.
+    _outlet_index: Dict[str, Tuple[Any, Dict[str, Any], Tuple[str, ...]]] = {}
+    # In-flight strip refreshes keyed by cache key, with their monotonic start
+    # time, joined by sibling outlets.
+    _pending_updates: Dict[str, Tuple[asyncio.Future, float]] = {}
+    # Strip object and monotonic start time of its last successful refresh.
+    _strip_refreshed_at: Dict[str, Tuple[Any, float]] = {}
+    # Monotonic time the last outlet command on each strip finished. Refreshes
+    # that started earlier describe the relays before the switch.
+    _strip_switched_at: Dict[str, float] = {}
+    # Lower-cased strip alias -> host for every strip seen during discovery, so
+    # outlets configured by name share one broadcast.
+    _discovered_hosts: Dict[str, str] = {}
+    # Named asyncio locks (discovery, per-strip connect) with the loop they belong to.
+    _locks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
 
     def __init__(self, config: Dict[str, Any]):
         self.id = config["id"]
         self.what = config.get("what", "power_device")
-        self._config = dict(config)
+        self._log = logger.bind(component="device", device_id=self.id)
 
         control = config["control"]
         if not control:
@@ -64,6 +106,7 @@ class KasaPowerbar:
 
         if not self.outlet_name:
             raise ValueError("KASA_Powerbar requires 'control.outlet_name'")
+        self._outlet_key = self.outlet_name.lower()  # key into the strip's alias index
 
         if not (self.device_name or self.ip_address):
             raise ValueError(
@@ -81,6 +124,8 @@ class KasaPowerbar:
             float(timeout_minutes) if timeout_minutes is not None else None
         )
         self._safety_enforce: bool = bool(safety_config.get("enforce", True))
+        # Safety config is fixed after init; parse it (and warn) only once.
+        self._safety_cached = self._parse_safety_settings()
 
         self._device: Any = None       # IotStrip / Device
         self._outlet: Any = None       # IotStripPlug / child device
@@ -95,12 +140,57 @@ class KasaPowerbar:
         return self.ip_address or f"name::{self.device_name}"
 
     async def _discover_host(self) -> str:
-        """Locate the power strip by its configured friendly name."""
-        discovered = await Discover.discover()
+        """Locate the power strip by its configured friendly name.
+
+        Hosts already seen by an earlier discovery are reused. Otherwise this
+        returns as soon as a strip with a matching alias answers instead of
+        waiting out the full discovery window.
+        """
+        wanted = self.device_name.lower()
+        async with self._loop_lock("discovery"):
+            host = self._discovered_hosts.get(wanted)
+            if host is None:
+                host = await self._run_discovery(wanted)
+            return host
+
+    @classmethod
+    def _loop_lock(cls, name: str) -> asyncio.Lock:
+        """Return the class-wide lock called *name* for the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = cls._locks.get(name)
+        if entry is None or entry[0] is not loop:
+            entry = cls._locks[name] = (loop, asyncio.Lock())
+        return entry[1]
+
+    async def _run_discovery(self, wanted: str) -> str:
+        """Broadcast for strips and return the host of the one aliased *wanted*."""
+        found: asyncio.Future = asyncio.get_running_loop().create_future()
+        discovered_hosts = self._discovered_hosts
+
+        async def _on_discovered(device: Any) -> None:
+            alias = getattr(device, "alias", "")
+            host = getattr(device, "host", None)
+            if not (host and alias):
+                return
+            host = discovered_hosts.setdefault(alias.lower(), host)
+            if alias.lower() == wanted and not found.done():
+                found.set_result(host)
+
+        discovery = asyncio.ensure_future(Discover.discover(on_discovered=_on_discovered))
+        await asyncio.wait({discovery, found}, return_when=asyncio.FIRST_COMPLETED)
+        if found.done():
+            discovery.cancel()
+            return found.result()
+
+        discovered = discovery.result()
         for host, device in discovered.items():
             alias = getattr(device, "alias", "")
-            if alias and alias.lower() == self.device_name.lower():
-                return host
+            if alias:
+                discovered_hosts.setdefault(alias.lower(), host)
+
+        host = discovered_hosts.get(wanted)
+        if host is not None:
+            return host
 
         raise ValueError(
             f"Unable to locate KASA power strip named '{self.device_name}' via discovery"
@@ -114,20 +204,38 @@ class KasaPowerbar:
         """Bind self._outlet to the configured child alias."""
         assert self._device is not None  # defensive
 
-        children = getattr(self._device, "children", [])
-        candidates = [
-            outlet
-            for outlet in children
-            if getattr(outlet, "alias", "").lower() == self.outlet_name.lower()
-        ]
-
-        if not candidates:
-            available = [getattr(child, "alias", "") for child in children]
+        outlet = self._strip_outlets()[0].get(self._outlet_key)
+        if outlet is None:
             raise ValueError(
-                f"Outlet '{self.outlet_name}' was not found. Available outlets: {available}"
+                f"Outlet '{self.outlet_name}' was not found. "
+                f"Available outlets: {self._list_outlets()}"
             )
+        if not hasattr(outlet, "is_on"):
+            raise ValueError(f"Outlet '{self.outlet_name}' does not report its power state")
+
+        self._outlet = outlet
 
-        self._outlet = candidates[0]
+    def _strip_outlets(self) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """Return the strip's outlets by lower-cased alias and its alias list.
+
+        Child aliases are read once per strip and shared by sibling outlets.
+        """
+        cache_key = self._cache_key()
+        cached = self._outlet_index.get(cache_key)
+        if cached is not None and cached[0] is self._device:
+            return cached[1], cached[2]
+
+        children = [
+            (getattr(outlet, "alias", ""), outlet)
+            for outlet in getattr(self._device, "children", [])
+        ]
+        index: Dict[str, Any] = {}
+        for alias, outlet in children:
+            index.setdefault(alias.lower(), outlet)
+        aliases = tuple(alias for alias, _ in children)
+
+        self._outlet_index[cache_key] = (self._device, index, aliases)
+        return index, aliases
 
     # ------------------------------------------------------------------
     # Public API
@@ -139,33 +247,38 @@ class KasaPowerbar:
             self.ip_address = await self._discover_host()
 
         cache_key = self._cache_key()
-        cached = self._device_cache.get(cache_key)
-
-        if cached is not None:
-            dev = cached
-            logger.bind(component="device", device_id=self.id).info(
-                f"Reusing existing connection to KASA power strip at {self.ip_address} "
-                f"(outlet '{self.outlet_name}')"
-            )
-        else:
-            logger.bind(component="device", device_id=self.id).info(
-                f"Connecting to KASA power strip at {self.ip_address} "
-                f"(outlet '{self.outlet_name}')"
-            )
-            dev = await Discover.discover_single(self.ip_address)
-            # proto may exist; honor configured port if we can
-            if hasattr(dev, "protocol") and hasattr(dev.protocol, "port"):
-                dev.protocol.port = self.port
-            await dev.update()
-            self._device_cache[cache_key] = dev
+        # Outlets on the same strip initializing concurrently wait here for the
+        # first one to connect, then reuse its cached strip.
+        async with self._loop_lock(f"connect::{cache_key}"):
+            cached = self._device_cache.get(cache_key)
+
+            if cached is not None:
+                dev = cached
+                self._log.info(
+                    "Reusing existing connection to KASA power strip at {} (outlet '{}')",
+                    self.ip_address,
+                    self.outlet_name,
+                )
+            else:
+                self._log.info(
+                    "Connecting to KASA power strip at {} (outlet '{}')",
+                    self.ip_address,
+                    self.outlet_name,
+                )
+                dev = await Discover.discover_single(self.ip_address)
+                # proto may exist; honor configured port if we can
+                if hasattr(dev, "protocol") and hasattr(dev.protocol, "port"):
+                    dev.protocol.port = self.port
+                await dev.update()
+                self._device_cache[cache_key] = dev
 
         self._device = dev
         self.address = getattr(dev, "host", self.ip_address)
         self._select_outlet()
         self._initialized = True
 
-        logger.bind(component="device", device_id=self.id).info(
-            f"KASA outlet '{self.outlet_name}' is ready for commands."
+        self._log.info(
+            "KASA outlet '{}' is ready for commands.", self.outlet_name
         )
 
     def get_metadata(self) -> Dict[str, Any]:
@@ -199,28 +312,75 @@ class KasaPowerbar:
 
     def _list_outlets(self) -> List[str]:
         assert self._device is not None  # defensive
-        return [getattr(child, "alias", "") for child in getattr(self._device, "children", [])]
+        return list(self._strip_outlets()[1])
 
     async def is_on(self) -> bool:
         """Return True when the configured outlet is powered on."""
         self._ensure_initialized()
-        await self._device.update()
-        return bool(getattr(self._outlet, "is_on", False))
+        await self._update_strip()
+        return self._outlet.is_on
+
+    async def _update_strip(self) -> None:
+        """Refresh the strip unless it is fresh, joining a sibling's refresh in flight."""
+        cache_key = self._cache_key()
+        device = self._device
+        refreshed = self._strip_refreshed_at.get(cache_key)
+        if (
+            refreshed is not None
+            and refreshed[0] is device
+            and time.monotonic() - refreshed[1] < STRIP_UPDATE_TTL_SECONDS
+        ):
+            return
+
+        entry = self._pending_updates.get(cache_key)
+        if (
+            entry is None
+            or entry[0].get_loop() is not asyncio.get_running_loop()
+            or entry[1] < self._strip_switched_at.get(cache_key, entry[1])
+        ):
+            started = time.monotonic()
+            pending = asyncio.ensure_future(device.update())
+            self._pending_updates[cache_key] = (pending, started)
+
+            def _forget(future: asyncio.Future, key: str = cache_key) -> None:
+                current = self._pending_updates.get(key)
+                if current is not None and current[0] is future:
+                    del self._pending_updates[key]
+                if future.cancelled() or future.exception() is not None:
+                    return
+                # A refresh that began before the last command may predate the switch.
+                if started >= self._strip_switched_at.get(key, started):
+                    self._strip_refreshed_at[key] = (device, started)
+
+            pending.add_done_callback(_forget)
+        else:
+            pending = entry[0]
+
+        # Shield so one cancelled caller does not cancel the refresh for the others.
+        await asyncio.shield(pending)
 
     async def _set_power_state(self, *, desired_state: bool) -> PowerCommandResult:
         self._ensure_initialized()
 
         async def _command() -> None:
-            if desired_state:
-                await self._outlet.turn_on()
-            else:
-                await self._outlet.turn_off()
+            try:
+                if desired_state:
+                    await self._outlet.turn_on()
+                else:
+                    await self._outlet.turn_off()
+            finally:
+                # Invalidate once the relay has switched, so no refresh taken
+                # mid-command can be reused as the post-command state.
+                cache_key = self._cache_key()
+                self._strip_switched_at[cache_key] = time.monotonic()
+                self._strip_refreshed_at.pop(cache_key, None)
 
         result = await ensure_power_state(
             desired_state=desired_state,
             device_id=self.id,
             device_label=self.outlet_name or self.id,
             read_state=self.is_on,
+            bound_logger=self._log,
             command=_command,
         )
 
@@ -244,8 +404,8 @@ class KasaPowerbar:
         """Return outlet-specific safety configuration if present."""
 
         # 1) Per-outlet block under control.outlets
-        outlet_specific = self._extract_outlet_config(control)
-        if isinstance(outlet_specific, dict):
+        outlet_specific = self._find_outlet_entry(control.get("outlets"))
+        if outlet_specific is not None:
             safety = outlet_specific.get("safety")
             if isinstance(safety, dict):
                 return safety
@@ -253,56 +413,38 @@ class KasaPowerbar:
         # 2) control.safety, optionally with per-outlet overrides
         control_safety = control.get("safety")
         if isinstance(control_safety, dict):
-            outlets_block = control_safety.get("outlets")
-            outlet_override = self._match_outlet_from_block(outlets_block)
+            outlet_override = self._find_outlet_entry(control_safety.get("outlets"))
             if outlet_override is not None:
                 return outlet_override
 
-            if self.outlet_name in control_safety and isinstance(
-                    control_safety.get(self.outlet_name), dict
-            ):
-                return control_safety[self.outlet_name]
+            named_override = control_safety.get(self.outlet_name)
+            if isinstance(named_override, dict):
+                return named_override
 
             return control_safety
 
         return {}
 
-    def _extract_outlet_config(self, control: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        outlets = control.get("outlets")
-
-        if isinstance(outlets, dict):
-            candidate = outlets.get(self.outlet_name)
-            if isinstance(candidate, dict):
-                return candidate
-
-        if isinstance(outlets, list):
-            for entry in outlets:
-                if (
-                        isinstance(entry, dict)
-                        and entry.get("outlet_name") == self.outlet_name
-                ):
-                    return entry
-
-        return None
-
-    def _match_outlet_from_block(self, outlets_block: Any) -> Optional[Dict[str, Any]]:
-        if isinstance(outlets_block, dict):
-            candidate = outlets_block.get(self.outlet_name)
+    def _find_outlet_entry(self, block: Any) -> Optional[Dict[str, Any]]:
+        """Return this outlet's entry from a name-keyed dict or a list of blocks."""
+        if isinstance(block, dict):
+            candidate = block.get(self.outlet_name)
             if isinstance(candidate, dict):
                 return candidate
 
-        if isinstance(outlets_block, list):
-            for entry in outlets_block:
-                if (
-                        isinstance(entry, dict)
-                        and entry.get("outlet_name") == self.outlet_name
-                ):
+        elif isinstance(block, list):
+            for entry in block:
+                if isinstance(entry, dict) and entry.get("outlet_name") == self.outlet_name:
                     return entry
 
         return None
 
     def _safety_settings(self) -> Tuple[Optional[bool], Optional[int], bool]:
         """Return parsed safety target, timeout (seconds), and enforce flag."""
+        return self._safety_cached
+
+    def _parse_safety_settings(self) -> Tuple[Optional[bool], Optional[int], bool]:
+        """Validate the configured safety block into ``_safety_settings`` form."""
         if not self._safety_enforce:
             return None, None, False
 
@@ -312,14 +454,14 @@ class KasaPowerbar:
         normalized = str(self._safety_target_state).lower()
         if normalized not in {"on", "off"}:
             logger.warning(
-                "Invalid safety target_state '%s' - expected 'on' or 'off'",
+                "Invalid safety target_state '{}' - expected 'on' or 'off'",
                 self._safety_target_state,
             )
             return None, None, False
 
         if self._safety_timeout_minutes is None:
             logger.warning(
-                "Safety target configured without a timeout for outlet '%s'",
+                "Safety target configured without a timeout for outlet '{}'",
                 self.outlet_name,
             )
             return None, None, False
@@ -348,11 +490,11 @@ class KasaPowerbar:
         if hasattr(self._outlet, "_query_helper"):
             try:
                 await self._outlet._query_helper("count_down", "delete_all_rules", {})
-                logger.debug("Cleared countdown rules for outlet '%s'", self.outlet_name)
+                logger.debug("Cleared countdown rules for outlet '{}'", self.outlet_name)
                 return True
             except Exception as exc:  # pragma: no cover
                 logger.warning(
-                    "Failed to clear countdown failsafe for outlet '%s': %s",
+                    "Failed to clear countdown failsafe for outlet '{}': {}",
                     self.outlet_name,
                     exc,
                 )
@@ -379,14 +521,14 @@ class KasaPowerbar:
             try:
                 await self._outlet._query_helper("count_down", "add_rule", params)
                 logger.debug(
-                    "Programmed countdown failsafe to switch %s in %s seconds",
+                    "Programmed countdown failsafe to switch {} in {} seconds",
                     "on" if target_state else "off",
                     timeout_seconds,
                 )
                 return True
             except Exception as exc:  # pragma: no cover
                 logger.warning(
-                    "Failed to program countdown failsafe for outlet '%s': %s",
+                    "Failed to program countdown failsafe for outlet '{}': {}",
                     self.outlet_name,
                     exc,
                 )
@@ -418,7 +560,7 @@ class KasaPowerbar:
             return
 
         logger.warning(
-            "KASA outlet '%s' does not expose a usable countdown failsafe; "
+            "KASA outlet '{}' does not expose a usable countdown failsafe; "
             "safety cannot be enforced",
             self.outlet_name,
         )
@@ -426,4 +568,4 @@ class KasaPowerbar:
     async def _clear_safety_programming(self) -> None:
         """Attempt to clear any previously programmed safety timers."""
         if await self._clear_countdown_rules():
-            logger.debug("Cleared safety programming for outlet '%s'", self.outlet_name)
+            logger.debug("Cleared safety programming for outlet '{}'", self.outlet_name)
@@ -1,18 +1,48 @@
+import copy
 import os
 import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Directory mtime_ns -> collected metadata; the device modules only change on disk.
+_METADATA_CACHE = {}
+
 
 def get_metadata():
     """Dynamically discover and collect metadata from all device modules."""
-    metadata = {}
     current_dir = os.path.dirname(__file__)
-    for filename in os.listdir(current_dir):
-        if filename.endswith(".py") and filename != "__init__.py":
-            module_name = filename[:-3]  # Remove .py extension
-            module_path = f"{__name__}.{module_name}"  # Full import path
-            try:
-                module = importlib.import_module(module_path)
-                if hasattr(module, "get_metadata"):
-                    metadata[module_name] = module.get_metadata()
-            except Exception as e:
-                print(f"Failed to load module {module_name}: {e}")
+    mtime_ns = os.stat(current_dir).st_mtime_ns
+    cached = _METADATA_CACHE.get(mtime_ns)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    with os.scandir(current_dir) as entries:
+        module_names = [
+            entry.name[:-3]  # Remove .py extension
+            for entry in entries
+            if entry.name.endswith(".py") and entry.name != "__init__.py"
+        ]
+
+    # Driver modules pull in heavy client libraries; import them side by side.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(module_names)))) as executor:
+        results = list(executor.map(_load_module_metadata, module_names))
+
+    metadata = {
+        module_name: module_metadata
+        for module_name, module_metadata in zip(module_names, results)
+        if module_metadata is not None
+    }
+    _METADATA_CACHE.clear()
+    _METADATA_CACHE[mtime_ns] = copy.deepcopy(metadata)
     return metadata
+
+
+def _load_module_metadata(module_name):
+    module_path = f"{__name__}.{module_name}"  # Full import path
+    try:
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        if hasattr(module, "get_metadata"):
+            return module.get_metadata()
+    except Exception as e:
+        print(f"Failed to load module {module_name}: {e}")
+    return None
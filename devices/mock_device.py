@@ -11,6 +11,19 @@ from devices.power_state import PowerCommandResult, ensure_power_state
 class MockDevice:
     """Simple mock device used for integration testing."""
 
+    __slots__ = (
+        "id",
+        "what",
+        "name",
+        "outlet_name",
+        "power_rating",
+        "circuit",
+        "location",
+        "address",
+        "timeout",
+        "_is_on",
+    )
+
     def __init__(self, config):
         self.id = config.get("id", "mock_device")
         self.what = config.get("what", "device")
@@ -50,6 +63,8 @@ class MockDevice:
 
     async def turn_on(self) -> PowerCommandResult:
         """Simulate powering on the device."""
+        if self._is_on:
+            return PowerCommandResult(command_sent=False, desired_state=True)
         return await ensure_power_state(
             desired_state=True,
             device_id=self.id,
@@ -60,6 +75,8 @@ class MockDevice:
 
     async def turn_off(self) -> PowerCommandResult:
         """Simulate powering off the device."""
+        if not self._is_on:
+            return PowerCommandResult(command_sent=False, desired_state=False)
         return await ensure_power_state(
             desired_state=False,
             device_id=self.id,
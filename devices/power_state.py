@@ -1,7 +1,9 @@
 """Common helpers for enforcing binary power states on devices.
 
 All device drivers must expose an async interface. This module provides
-a single async helper for power state management.
+an async helper for power state management, plus a synchronous counterpart
+for drivers whose client library blocks and runs on a worker thread. Both
+apply the same rules.
 
 Verification of commanded state is handled by the control loop on subsequent
 cycles, not immediately after command. This avoids race conditions with
@@ -15,8 +17,11 @@ from typing import Awaitable, Callable, Optional
 
 from loguru import logger
 
+# Indexed by a bool: _STATE_LABELS[True] == "on".
+_STATE_LABELS = ("off", "on")
 
-@dataclass
+
+@dataclass(slots=True)
 class PowerCommandResult:
     """Result of a power command attempt."""
 
@@ -34,6 +39,7 @@ async def ensure_power_state(
     device_label: str,
     read_state: Optional[Callable[[], Awaitable[bool]]],
     command: Callable[[], Awaitable[None]],
+    bound_logger=None,
 ) -> PowerCommandResult:
     """
     Apply an on/off command with pre-read to avoid redundant commands.
@@ -48,32 +54,61 @@ async def ensure_power_state(
         read_state: Async function returning current power state, or None
                     if device doesn't support state queries.
         command: Async function that performs the actual power change.
+        bound_logger: Logger already bound to this device; bound on demand
+                      when omitted.
 
     Returns:
         PowerCommandResult with command_sent and desired_state fields.
     """
-    bound_logger = logger.bind(component="device", device_id=device_id)
+    if bound_logger is None:
+        bound_logger = logger.bind(component="device", device_id=device_id)
 
     pre_state = await _read_state(read_state, bound_logger, device_label)
 
-    if pre_state is not None and pre_state == desired_state:
-        bound_logger.debug(
-            "No-op for '{}': already {}", device_label, _state_label(desired_state)
-        )
+    if _already_in_state(pre_state, desired_state, bound_logger, device_label):
         return PowerCommandResult(command_sent=False, desired_state=desired_state)
 
     await command()
 
-    bound_logger.debug(
-        "Command sent to '{}': {}", device_label, _state_label(desired_state)
-    )
+    return _command_sent(desired_state, bound_logger, device_label)
 
-    return PowerCommandResult(command_sent=True, desired_state=desired_state)
 
+def ensure_power_state_sync(
+    *,
+    desired_state: bool,
+    device_id: str,
+    device_label: str,
+    read_state: Optional[Callable[[], bool]],
+    command: Callable[[], None],
+    bound_logger=None,
+) -> PowerCommandResult:
+    """
+    Blocking counterpart of :func:`ensure_power_state`.
+
+    For drivers that run the pre-read and command together in one worker
+    thread; the arguments match, with plain callables in place of coroutines.
+    """
+    if bound_logger is None:
+        bound_logger = logger.bind(component="device", device_id=device_id)
+
+    pre_state = None
+    if read_state is not None:
+        try:
+            pre_state = _as_state(read_state())
+        except Exception as exc:
+            _warn_read_failed(bound_logger, device_label, exc)
+
+    if _already_in_state(pre_state, desired_state, bound_logger, device_label):
+        return PowerCommandResult(command_sent=False, desired_state=desired_state)
+
+    command()
 
-def _state_label(state: bool) -> str:
+    return _command_sent(desired_state, bound_logger, device_label)
+
+
+def state_label(state: bool) -> str:
     """Convert boolean state to human-readable label."""
-    return "on" if state else "off"
+    return _STATE_LABELS[bool(state)]
 
 
 async def _read_state(
@@ -86,12 +121,38 @@ async def _read_state(
         return None
 
     try:
-        state = await read_state()
-        return bool(state) if state is not None else None
+        return _as_state(await read_state())
     except Exception as exc:
-        bound_logger.warning(
-            "Unable to read power state for '{}' before command: {}",
-            device_label,
-            exc,
-        )
+        _warn_read_failed(bound_logger, device_label, exc)
         return None
+
+
+def _as_state(state: object) -> Optional[bool]:
+    return bool(state) if state is not None else None
+
+
+def _warn_read_failed(bound_logger, device_label: str, exc: Exception) -> None:
+    bound_logger.warning(
+        "Unable to read power state for '{}' before command: {}",
+        device_label,
+        exc,
+    )
+
+
+def _already_in_state(
+    pre_state: Optional[bool], desired_state: bool, bound_logger, device_label: str
+) -> bool:
+    """Return True (and log the no-op) when the device already reports *desired_state*."""
+    if pre_state is not None and pre_state == desired_state:
+        bound_logger.debug(
+            "No-op for '{}': already {}", device_label, _STATE_LABELS[desired_state]
+        )
+        return True
+    return False
+
+
+def _command_sent(desired_state: bool, bound_logger, device_label: str) -> PowerCommandResult:
+    bound_logger.debug(
+        "Command sent to '{}': {}", device_label, _STATE_LABELS[desired_state]
+    )
+    return PowerCommandResult(command_sent=True, desired_state=desired_state)
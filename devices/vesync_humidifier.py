@@ -1,19 +1,71 @@
 """Control integration for VeSync-connected humidifiers.
 
-The pyvesync library is synchronous, so this driver wraps all blocking
-calls with asyncio.to_thread() to conform to the async-first architecture.
+The pyvesync library is synchronous, so this driver runs all blocking
+calls on a dedicated thread pool to conform to the async-first architecture.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
 
 from loguru import logger
 from pyvesync import VeSync
 
-from devices.power_state import PowerCommandResult, ensure_power_state
+from devices.power_state import PowerCommandResult, ensure_power_state_sync
+
+DEFAULT_STATUS_TTL_SECONDS = 1.5
+DEFAULT_TIME_ZONE = "America/New_York"
+# Humidifiers initialised together share one device-list refresh.
+MANAGER_UPDATE_TTL_SECONDS = 5.0
+
+# One logged-in VeSync session per (email, time_zone, password digest), shared by
+# every humidifier on the account; a device with different credentials logs in
+# itself. Each account has its own thread lock (these run on worker threads) so
+# login/refresh is serialised per account, not across accounts.
+_MANAGER_CACHE: Dict[Tuple[str, str, str], VeSync] = {}
+_MANAGER_UPDATED_AT: Dict[Tuple[str, str, str], float] = {}
+_MANAGER_LOCKS: Dict[Tuple[str, str, str], threading.Lock] = {}
+# Selected device handles by (*manager key, lower-cased name), reused on re-init.
+_DEVICE_CACHE: Dict[Tuple[str, str, str, str], object] = {}
+
+# Retry policy for cloud login: exponential backoff with up to 20% jitter.
+# pyvesync swallows request errors, so a network outage and a rejected password
+# both surface as login() returning False; both are retried up to the limit.
+CLOUD_MAX_ATTEMPTS = 5
+CLOUD_BACKOFF_BASE_SECONDS = 1.0
+CLOUD_BACKOFF_CAP_SECONDS = 60.0
+# Transport errors that escape pyvesync (requests' exceptions subclass OSError).
+_TRANSIENT_ERRORS = (OSError,)
+
+T = TypeVar("T")
+
+# Cloud calls get their own pool so they never queue behind the default executor.
+_VESYNC_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vesync")
+
+_EXTRA_DEVICE_LISTS = ("fans", "outlets", "switches", "bulbs", "scales", "motionsensors")
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking pyvesync call on the VeSync thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_VESYNC_EXECUTOR, func, *args)
+
+
+def _looks_like_humidifier(device: object) -> bool:
+    """Return True when the device's name, type or category mentions 'humid'."""
+    # NUL-separated so a match cannot straddle two fields.
+    blob = (
+        f"{getattr(device, 'device_name', '')}\0"
+        f"{getattr(device, 'device_type', '')}\0"
+        f"{getattr(device, 'device_category', '')}"
+    )
+    return "humid" in blob.lower()
 
 
 def get_metadata() -> Dict[str, Any]:
@@ -28,6 +80,8 @@ def get_metadata() -> Dict[str, Any]:
                 "email": "VeSync account email used for authentication.",
                 "password": "VeSync account password used for authentication.",
                 "time_zone": "Optional IANA time zone (e.g. 'America/New_York').",
+                "status_ttl": "Optional seconds to reuse a status read before querying the cloud again (default 1.5).",
+                "command_jitter": "Optional upper bound, in seconds, of a random delay before each power command (default 0).",
             },
             "power": {
                 "circuit": "Optional circuit identifier for logging/metadata.",
@@ -40,10 +94,33 @@ def get_metadata() -> Dict[str, Any]:
 class VesyncHumidifier:
     """Interface to manage VeSync-compatible humidifiers."""
 
+    __slots__ = (
+        "id",
+        "what",
+        "_log",
+        "device_name",
+        "_device_name_lower",
+        "email",
+        "password",
+        "time_zone",
+        "_status_ttl",
+        "_command_jitter",
+        "power_rating",
+        "circuit",
+        "_manager",
+        "_device_list_attrs",
+        "_device",
+        "_device_update",
+        "_initialized",
+        "_initializing",
+        "_cached_status",
+        "_cached_at",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.id = config.get("id", "vesync_humidifier")
         self.what = config.get("what", "humidifier")
-        self._config = dict(config)
+        self._log = logger.bind(component="device", device_id=self.id)
 
         control = config.get("control") or {}
         if not control:
@@ -53,9 +130,12 @@ class VesyncHumidifier:
         self.email: Optional[str] = control.get("email") or control.get("username")
         self.password: Optional[str] = control.get("password")
         self.time_zone: Optional[str] = control.get("time_zone")
+        self._status_ttl = float(control.get("status_ttl", DEFAULT_STATUS_TTL_SECONDS))
+        self._command_jitter = float(control.get("command_jitter", 0.0))
 
         if not self.device_name:
             raise ValueError("VesyncHumidifier requires 'control.name'")
+        self._device_name_lower = self.device_name.lower()
         if not self.email or not self.password:
             raise ValueError("VesyncHumidifier requires 'control.email' and 'control.password'")
 
@@ -64,92 +144,119 @@ class VesyncHumidifier:
         self.circuit = power.get("circuit")
 
         self._manager: Optional[VeSync] = None
+        self._device_list_attrs: Tuple[str, ...] = ()
         self._device = None
+        self._device_update: Optional[Callable[[], Any]] = None
         self._initialized = False
+        self._initializing: Optional[asyncio.Future] = None
+        self._cached_status = False
+        self._cached_at = 0.0  # monotonic time of the last status read; 0 means stale
 
     # ------------------------------------------------------------------
-    # Sync helpers (called via to_thread)
+    # Sync helpers (called via _run_blocking)
     # ------------------------------------------------------------------
     def _sync_initialize(self) -> None:
         """Synchronous initialization — runs in thread pool."""
-        self._manager = VeSync(
-            self.email,
-            self.password,
-            time_zone=self.time_zone or "America/New_York",
+        self._manager = self._shared_manager()
+        # The manager's layout depends on the pyvesync version, not on the account.
+        self._device_list_attrs = tuple(
+            attr for attr in _EXTRA_DEVICE_LISTS if hasattr(self._manager, attr)
         )
-
-        if not self._manager.login():
-            raise RuntimeError(f"VeSync login failed for account '{self.email}'")
-
         self._select_device()
         self._initialized = True
 
-        logger.bind(component="device", device_id=self.id).info(
-            f"VeSync humidifier '{self.device_name}' initialized successfully"
-        )
+        self._log.info("VeSync humidifier '{}' initialized successfully", self.device_name)
 
     def _sync_is_on(self) -> bool:
         """Synchronous state check — runs in thread pool."""
         self._ensure_initialized()
 
-        update = getattr(self._device, "update", None)
-        if callable(update):
-            update()
+        # Each update() is a cloud round-trip; reuse a read from this control cycle.
+        cached = self._recent_status()
+        if cached is not None:
+            return cached
+
+        if self._device_update is not None:
+            self._device_update()
 
         status = getattr(self._device, "device_status", None)
         if isinstance(status, str):
-            return status.lower() == "on"
+            is_on = status.lower() == "on"
+        else:
+            is_on = bool(getattr(self._device, "is_on", False))
+
+        self._cached_status = is_on
+        self._cached_at = time.monotonic()
+        return is_on
 
-        return bool(getattr(self._device, "is_on", False))
+    def _recent_status(self) -> Optional[bool]:
+        """Return the cached status while it is fresh, otherwise None."""
+        if self._cached_at and time.monotonic() - self._cached_at < self._status_ttl:
+            return self._cached_status
+        return None
 
     def _sync_turn_on(self) -> None:
         """Synchronous turn on — runs in thread pool."""
         self._ensure_initialized()
+        self._cached_at = 0.0
         self._device.turn_on()
 
     def _sync_turn_off(self) -> None:
         """Synchronous turn off — runs in thread pool."""
         self._ensure_initialized()
+        self._cached_at = 0.0
         self._device.turn_off()
 
+    def _sync_apply_power(self, desired_state: bool) -> PowerCommandResult:
+        """Synchronous ensure-state — runs in thread pool."""
+        return ensure_power_state_sync(
+            desired_state=desired_state,
+            device_id=self.id,
+            device_label=self.device_name,
+            read_state=self._sync_is_on,
+            command=self._sync_turn_on if desired_state else self._sync_turn_off,
+            bound_logger=self._log,
+        )
+
     # ------------------------------------------------------------------
     # Async public interface
     # ------------------------------------------------------------------
     async def initialize(self) -> None:
-        """Authenticate with VeSync and locate the configured humidifier."""
-        await asyncio.to_thread(self._sync_initialize)
+        """Authenticate with VeSync and locate the configured humidifier.
+
+        Concurrent calls share one in-flight initialisation.
+        """
+        pending = self._initializing
+        if pending is None:
+            pending = asyncio.ensure_future(_run_blocking(self._sync_initialize))
+            self._initializing = pending
+
+            def _forget(_: asyncio.Future) -> None:
+                self._initializing = None
+
+            pending.add_done_callback(_forget)
+
+        # Shield so one cancelled caller does not abort the login for the others.
+        await asyncio.shield(pending)
 
     async def is_on(self) -> bool:
         """Return True when the humidifier is running."""
-        return await asyncio.to_thread(self._sync_is_on)
+        return await _run_blocking(self._sync_is_on)
 
     async def turn_on(self) -> PowerCommandResult:
         """Turn on the humidifier."""
-        return await ensure_power_state(
-            desired_state=True,
-            device_id=self.id,
-            device_label=self.device_name or self.id,
-            read_state=self.is_on,
-            command=self._async_turn_on,
-        )
+        return await self._apply_power(True)
 
     async def turn_off(self) -> PowerCommandResult:
         """Turn off the humidifier."""
-        return await ensure_power_state(
-            desired_state=False,
-            device_id=self.id,
-            device_label=self.device_name or self.id,
-            read_state=self.is_on,
-            command=self._async_turn_off,
-        )
-
-    async def _async_turn_on(self) -> None:
-        """Async wrapper for sync turn_on."""
-        await asyncio.to_thread(self._sync_turn_on)
+        return await self._apply_power(False)
 
-    async def _async_turn_off(self) -> None:
-        """Async wrapper for sync turn_off."""
-        await asyncio.to_thread(self._sync_turn_off)
+    async def _apply_power(self, desired_state: bool) -> PowerCommandResult:
+        """Run the pre-read and command in a single worker-thread hop."""
+        if self._command_jitter > 0:
+            # Spread humidifiers commanded on the same tick across the window.
+            await asyncio.sleep(random.uniform(0, self._command_jitter))
+        return await _run_blocking(self._sync_apply_power, desired_state)
 
     def get_metadata(self) -> Dict[str, Any]:
         """Return descriptive metadata for the humidifier."""
@@ -173,6 +280,57 @@ class VesyncHumidifier:
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
+    def _manager_key(self) -> Tuple[str, str, str]:
+        password_digest = hashlib.sha256(self.password.encode("utf-8")).hexdigest()
+        return self.email, self.time_zone or DEFAULT_TIME_ZONE, password_digest
+
+    def _shared_manager(self) -> VeSync:
+        """Return the logged-in manager for this account, logging in once."""
+        key = self._manager_key()
+        with _MANAGER_LOCKS.setdefault(key, threading.Lock()):
+            manager = _MANAGER_CACHE.get(key)
+            if manager is None:
+                manager = VeSync(self.email, self.password, time_zone=key[1])
+
+                if not self._with_backoff(manager.login, "login"):
+                    raise RuntimeError(f"VeSync login failed for account '{self.email}'")
+                _MANAGER_CACHE[key] = manager
+            return manager
+
+    def _refresh_manager(self) -> None:
+        """Refresh the account's device list unless a sibling just did."""
+        key = self._manager_key()
+        with _MANAGER_LOCKS.setdefault(key, threading.Lock()):
+            refreshed_at = _MANAGER_UPDATED_AT.get(key)
+            now = time.monotonic()
+            if refreshed_at is not None and now - refreshed_at < MANAGER_UPDATE_TTL_SECONDS:
+                return
+            # update() logs and swallows its own request errors; nothing to retry.
+            self._manager.update()
+            _MANAGER_UPDATED_AT[key] = time.monotonic()
+
+    def _with_backoff(self, operation: Callable[[], T], description: str) -> T:
+        """Run a cloud call, retrying False results and transport errors with backoff."""
+        attempt = 0
+        while True:
+            try:
+                result = operation()
+            except _TRANSIENT_ERRORS as exc:
+                if attempt + 1 >= CLOUD_MAX_ATTEMPTS:
+                    raise
+                reason: object = exc
+            else:
+                if result is not False or attempt + 1 >= CLOUD_MAX_ATTEMPTS:
+                    return result
+                reason = "returned False"
+            delay = min(CLOUD_BACKOFF_CAP_SECONDS, CLOUD_BACKOFF_BASE_SECONDS * 2**attempt)
+            delay *= 1 + random.uniform(0, 0.2)
+            self._log.warning(
+                "VeSync {} failed ({}); retrying in {:.1f}s", description, reason, delay
+            )
+            time.sleep(delay)
+            attempt += 1
+
     def _ensure_initialized(self) -> None:
         if not self._initialized or self._device is None:
             raise RuntimeError("VesyncHumidifier has not been initialized")
@@ -183,7 +341,8 @@ class VesyncHumidifier:
         devices: list[object] = []
 
         for device in chain.from_iterable(dev_iterables):
-            identifier = (getattr(device, "uuid", None), getattr(device, "cid", None))
+            # uuid/cid are unique per VeSync device; objects without either are kept.
+            identifier = getattr(device, "uuid", None) or getattr(device, "cid", None) or id(device)
             if identifier in seen:
                 continue
             seen.add(identifier)
@@ -191,65 +350,94 @@ class VesyncHumidifier:
 
         return devices
 
-    def _candidate_devices(self) -> list[object]:
-        """Return all devices reported by VeSync that could be humidifiers."""
-        assert self._manager is not None
-
+    def _humidifier_lists(self) -> Iterator[Iterable[object]]:
+        """Yield the lists the manager itself classifies as humidifiers."""
         humidifiers = getattr(self._manager, "humidifiers", None)
-        devices_mapping = getattr(self._manager, "devices", {})
+        if humidifiers:
+            yield humidifiers
 
-        devices_from_mapping = []
+        devices_mapping = getattr(self._manager, "devices", {})
         if isinstance(devices_mapping, dict):
-            devices_from_mapping.extend(
-                devices_mapping.get("humidifier") or devices_mapping.get("humidifiers") or []
-            )
+            yield devices_mapping.get("humidifier") or devices_mapping.get("humidifiers") or ()
+
+    def _reported_device_lists(self) -> Iterator[Iterable[object]]:
+        """Yield every device list the manager exposes, humidifiers first."""
+        manager = self._manager
+        yield from self._humidifier_lists()
 
-        additional_lists = []
-        for attr in ("fans", "outlets", "switches", "bulbs", "scales", "motionsensors"):
-            devs = getattr(self._manager, attr, None)
+        for attr in self._device_list_attrs:
+            devs = getattr(manager, attr)
             if devs:
-                additional_lists.append(devs)
+                yield devs
 
-        extra_from_dev_list = []
-        dev_list = getattr(self._manager, "_dev_list", {})
+        dev_list = getattr(manager, "_dev_list", {})
         if isinstance(dev_list, dict):
-            extra_from_dev_list.extend(dev_list.values())
+            yield from dev_list.values()
 
-        candidates = self._flatten_devices(
-            [humidifiers or [], devices_from_mapping, *additional_lists, *extra_from_dev_list]
-        )
+    def _candidate_devices(self) -> list[object]:
+        """Return all devices reported by VeSync that could be humidifiers."""
+        assert self._manager is not None
+
+        candidates = self._flatten_devices(self._reported_device_lists())
 
         if not candidates:
             return []
 
-        def looks_like_humidifier(device: object) -> bool:
-            name = getattr(device, "device_name", "").lower()
-            device_type = getattr(device, "device_type", "").lower()
-            category = getattr(device, "device_category", "").lower()
-            return "humid" in name or "humid" in device_type or "humid" in category
-
-        humidifier_candidates = [d for d in candidates if looks_like_humidifier(d)]
+        humidifier_candidates = [d for d in candidates if _looks_like_humidifier(d)]
         return humidifier_candidates or candidates
 
     def _select_device(self) -> None:
         assert self._manager is not None
-        self._manager.update()
+        cache_key = (*self._manager_key(), self._device_name_lower)
+        # Shared with sibling humidifiers, so a reconnect wave refreshes once per TTL.
+        self._refresh_manager()
+
+        cached = _DEVICE_CACHE.get(cache_key)
+        if cached is not None:
+            # Re-initialising: keep the handle while the refreshed account still
+            # reports it, skipping the name scan.
+            reported = self._reported_device(cached)
+            if reported is not None:
+                self._bind_device(reported)
+                _DEVICE_CACHE[cache_key] = reported
+                return
+
+        # Properly categorised humidifiers are matched without the full account scan.
+        for device in chain.from_iterable(self._humidifier_lists()):
+            if getattr(device, "device_name", "").lower() == self._device_name_lower:
+                self._bind_device(device)
+                _DEVICE_CACHE[cache_key] = device
+                return
 
         humidifiers = self._candidate_devices()
 
         if not humidifiers:
             raise RuntimeError("Connected VeSync account does not report any humidifiers")
 
-        matches = [
-            device
-            for device in humidifiers
-            if getattr(device, "device_name", "").lower() == self.device_name.lower()
-        ]
+        by_name: Dict[str, object] = {}
+        for device in humidifiers:
+            by_name.setdefault(getattr(device, "device_name", "").lower(), device)
 
-        if not matches:
+        match = by_name.get(self._device_name_lower)
+        if match is None:
             available = [getattr(device, "device_name", "") for device in humidifiers]
             raise ValueError(
                 f"Humidifier '{self.device_name}' was not found. Available devices: {available}"
             )
 
-        self._device = matches[0]
+        self._bind_device(match)
+        _DEVICE_CACHE[cache_key] = self._device
+
+    def _bind_device(self, device: object) -> None:
+        """Select ``device`` and capture its refresh method for status reads."""
+        self._device = device
+        update = getattr(device, "update", None)
+        self._device_update = update if callable(update) else None
+
+    def _reported_device(self, cached: object) -> Optional[object]:
+        """Return the manager's current handle for a previously selected device."""
+        uuid = getattr(cached, "uuid", None)
+        for device in self._candidate_devices():
+            if device is cached or (uuid is not None and getattr(device, "uuid", None) == uuid):
+                return device
+        return None
@@ -8,6 +8,9 @@ from loguru import logger
 
 ConfigAdapter = Callable[[Dict], Dict]
 
+# (package, model_name) -> (class name, entity class); definitions often repeat a model.
+_RESOLVED_CACHE: Dict[Tuple[str, str], Tuple[str, type]] = {}
+
 
 def _resolve_module_and_class(model_name: str, package: str) -> Tuple[str, str]:
     """Resolve the import path and class name for a pluggable entity."""
@@ -23,6 +26,19 @@ def _resolve_module_and_class(model_name: str, package: str) -> Tuple[str, str]:
     return module_path, class_name
 
 
+def _resolve_entity_class(model_name: str, package: str) -> Tuple[str, type]:
+    """Import and return the class for ``model_name``, reusing earlier lookups."""
+
+    key = (package, model_name)
+    resolved = _RESOLVED_CACHE.get(key)
+    if resolved is None:
+        module_path, class_name = _resolve_module_and_class(model_name, package)
+        module = import_module(module_path)
+        resolved = (class_name, getattr(module, class_name))
+        _RESOLVED_CACHE[key] = resolved
+    return resolved
+
+
 def _identity_config_adapter(config: Dict) -> Dict:
     """Return a shallow copy of the provided configuration."""
 
@@ -44,9 +60,7 @@ def load_entities(
     for entity_config in entity_definitions:
         try:
             model_name = entity_config["how"]
-            module_path, class_name = _resolve_module_and_class(model_name, package)
-            module = import_module(module_path)
-            entity_class = getattr(module, class_name)
+            class_name, entity_class = _resolve_entity_class(model_name, package)
 
             entity = entity_class(adapter(entity_config))
             entities.append(entity)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 
@@ -24,6 +24,42 @@ class SchemaValidationError(Exception):
         return ".".join(str(part) for part in self.path)
 
 
+# Paths are built as linked ``(parent, key)`` pairs while walking and only
+# turned into a tuple when an error is reported; ``None`` is the root.
+_PathNode = Optional[Tuple[Any, Any]]
+
+# Marks a deferred failure on the work stack so errors keep depth-first order.
+_FAIL = object()
+
+
+_NOT_SET = object()
+
+
+@dataclass(slots=True)
+class _CompiledSchema:
+    """A subschema with its keywords read out once, ready for repeated validation."""
+
+    expected_types: Optional[List[Any]]
+    enum: Any
+    format: Optional[str]
+    minimum: Any
+    any_of: Any
+    object_ok: bool
+    required: Any
+    properties: Any
+    additional: Any
+    min_properties: Any
+    array_ok: bool
+    min_items: Any
+    items: Optional["_CompiledSchema"]
+
+
+# (schema, compiled) for the last root schema validated against. The config
+# loader reuses one parsed schema per file, so a single entry is enough, and
+# replacing it means an edited schema does not pin the old one in memory.
+_LAST_COMPILED: Optional[tuple] = None
+
+
 def validate_schema(instance: Any, schema: Mapping[str, Any]) -> None:
     """Validate *instance* against *schema*.
 
@@ -32,119 +68,218 @@ def validate_schema(instance: Any, schema: Mapping[str, Any]) -> None:
     on failure.
     """
 
-    _validate(instance, schema, ())
+    global _LAST_COMPILED
+
+    entry = _LAST_COMPILED
+    if entry is None or entry[0] is not schema:
+        entry = _LAST_COMPILED = (schema, _compiled(schema))
+    _validate(instance, entry[1], None)
+
 
+def _compiled(schema: Any) -> Optional[_CompiledSchema]:
+    """Compile *schema*; anything that is not a mapping places no constraints."""
 
-def _validate(instance: Any, schema: Mapping[str, Any], path: Sequence[Any]) -> None:
     if not isinstance(schema, Mapping):
-        return
+        return None
+    return _compile_schema(schema)
+
+
+def _compile_schema(schema: Mapping[str, Any]) -> _CompiledSchema:
+    # The "$schema" keyword is never read here, so Draft-07 documents need no
+    # special handling.
+    expected_types = None
+    if "type" in schema:
+        expected = schema["type"]
+        expected_types = list(expected) if isinstance(expected, (list, tuple)) else [expected]
 
-    # Draft-07 allows the "$schema" keyword, which we can safely ignore.
-    if "$schema" in schema:
-        schema = {k: v for k, v in schema.items() if k != "$schema"}
+    any_of = schema.get("anyOf", _NOT_SET)
+    if any_of is not _NOT_SET and isinstance(any_of, Sequence):
+        any_of = [_compiled(option) for option in any_of]
+
+    additional = schema.get("additionalProperties", True)
+    if isinstance(additional, Mapping):
+        additional = _compiled(additional)
+    elif additional is not False:
+        additional = True
+
+    item_schema = schema.get("items")
+
+    return _CompiledSchema(
+        expected_types=expected_types,
+        enum=schema.get("enum", _NOT_SET),
+        format=schema.get("format"),
+        minimum=schema.get("minimum", _NOT_SET),
+        any_of=any_of,
+        object_ok=schema.get("type") in (None, "object", ["object"]),
+        required=schema.get("required", []),
+        properties={
+            key: _compiled(subschema)
+            for key, subschema in schema.get("properties", {}).items()
+        },
+        additional=additional,
+        min_properties=schema.get("minProperties", _NOT_SET),
+        array_ok=schema.get("type") in (None, "array", ["array"]),
+        min_items=schema.get("minItems", _NOT_SET),
+        items=_compiled(item_schema),
+    )
+
+
+def _path(node: _PathNode) -> Tuple[Any, ...]:
+    parts = []
+    while node is not None:
+        node, key = node
+        parts.append(key)
+    parts.reverse()
+    return tuple(parts)
+
+
+def _validate(instance: Any, schema: Optional[_CompiledSchema], node: _PathNode) -> None:
+    # Iterative depth-first walk: children are pushed in reverse so they are
+    # checked in document order, exactly as the recursive form did.
+    stack: List[Tuple[Any, Any, _PathNode]] = [(instance, schema, node)]
+    while stack:
+        instance, schema, node = stack.pop()
+        if instance is _FAIL:
+            raise SchemaValidationError(_path(node), schema)
+        if schema is None:
+            continue
+
+        _validate_node(instance, schema, node)
+
+        if isinstance(instance, Mapping):
+            children = _object_children(instance, schema, node)
+        elif isinstance(instance, (list, tuple)):
+            children = _array_children(instance, schema, node)
+        else:
+            continue
+        children.reverse()
+        stack.extend(children)
+
+
+def _validate_node(instance: Any, schema: _CompiledSchema, node: _PathNode) -> None:
+    """Apply the keywords that constrain *instance* itself, not its children."""
 
     # Handle anyOf before applying the rest of the constraints so that one of
     # the subschemas can succeed.
-    if "anyOf" in schema:
-        options = schema["anyOf"]
-        if not isinstance(options, Sequence):
-            raise SchemaValidationError(path, "'anyOf' must be an array")
+    options = schema.any_of
+    if options is not _NOT_SET:
+        if not isinstance(options, list):
+            raise SchemaValidationError(_path(node), "'anyOf' must be an array")
         for option in options:
             try:
-                _validate(instance, option, path)
+                _validate(instance, option, node)
             except SchemaValidationError:
                 continue
             else:
                 break
         else:
-            raise SchemaValidationError(path, "Value does not satisfy any allowed schema")
+            raise SchemaValidationError(_path(node), "Value does not satisfy any allowed schema")
 
-    if "type" in schema:
-        _ensure_type(instance, schema["type"], path)
-
-    if "enum" in schema:
-        allowed = schema["enum"]
-        if instance not in allowed:
-            raise SchemaValidationError(path, f"Expected one of {allowed!r}, got {instance!r}")
+    if schema.expected_types is not None:
+        _ensure_type(instance, schema.expected_types, node)
 
-    if "format" in schema and isinstance(instance, str):
-        _validate_format(instance, schema["format"], path)
+    allowed = schema.enum
+    if allowed is not _NOT_SET and instance not in allowed:
+        raise SchemaValidationError(_path(node), f"Expected one of {allowed!r}, got {instance!r}")
 
-    if "minimum" in schema and isinstance(instance, (int, float)) and not isinstance(instance, bool):
-        minimum = schema["minimum"]
-        if instance < minimum:
-            raise SchemaValidationError(path, f"Value {instance!r} is less than minimum {minimum!r}")
+    if schema.format is not None and isinstance(instance, str):
+        _validate_format(instance, schema.format, node)
 
-    if isinstance(instance, Mapping):
-        _validate_object(instance, schema, path)
-    elif isinstance(instance, (list, tuple)):
-        _validate_array(instance, schema, path)
+    minimum = schema.minimum
+    if (
+        minimum is not _NOT_SET
+        and isinstance(instance, (int, float))
+        and not isinstance(instance, bool)
+        and instance < minimum
+    ):
+        raise SchemaValidationError(
+            _path(node), f"Value {instance!r} is less than minimum {minimum!r}"
+        )
 
 
-def _validate_object(instance: Mapping[str, Any], schema: Mapping[str, Any], path: Sequence[Any]) -> None:
-    if schema.get("type") not in (None, "object", ["object"]):
-        return
+def _object_children(
+    instance: Mapping[str, Any], schema: _CompiledSchema, node: _PathNode
+) -> List[Tuple[Any, Any, _PathNode]]:
+    if not schema.object_ok:
+        return []
 
-    required = schema.get("required", [])
-    for key in required:
+    for key in schema.required:
         if key not in instance:
-            raise SchemaValidationError(path + (key,), "Missing required property")
+            raise SchemaValidationError(_path((node, key)), "Missing required property")
 
-    properties = schema.get("properties", {})
-    additional = schema.get("additionalProperties", True)
-
-    if "minProperties" in schema and len(instance) < schema["minProperties"]:
-        raise SchemaValidationError(path, "Object has fewer properties than allowed")
+    min_properties = schema.min_properties
+    if min_properties is not _NOT_SET and len(instance) < min_properties:
+        raise SchemaValidationError(_path(node), "Object has fewer properties than allowed")
 
+    properties = schema.properties
+    additional = schema.additional
+    children = []
     for key, value in instance.items():
         if key in properties:
-            _validate(value, properties[key], path + (key,))
-        else:
-            if additional is False:
-                raise SchemaValidationError(path + (key,), "Additional properties are not allowed")
-            if isinstance(additional, Mapping):
-                _validate(value, additional, path + (key,))
+            children.append((value, properties[key], (node, key)))
+        elif additional is False:
+            children.append((_FAIL, "Additional properties are not allowed", (node, key)))
+        elif additional is not True:
+            children.append((value, additional, (node, key)))
+    return children
 
 
-def _validate_array(instance: Sequence[Any], schema: Mapping[str, Any], path: Sequence[Any]) -> None:
-    if schema.get("type") not in (None, "array", ["array"]):
-        return
+def _array_children(
+    instance: Sequence[Any], schema: _CompiledSchema, node: _PathNode
+) -> List[Tuple[Any, Any, _PathNode]]:
+    if not schema.array_ok:
+        return []
 
-    if "minItems" in schema and len(instance) < schema["minItems"]:
-        raise SchemaValidationError(path, "Array has fewer items than allowed")
+    min_items = schema.min_items
+    if min_items is not _NOT_SET and len(instance) < min_items:
+        raise SchemaValidationError(_path(node), "Array has fewer items than allowed")
 
-    item_schema = schema.get("items")
-    if isinstance(item_schema, Mapping):
-        for index, item in enumerate(instance):
-            _validate(item, item_schema, path + (index,))
+    item_schema = schema.items
+    if item_schema is None:
+        return []
+    return [(item, item_schema, (node, index)) for index, item in enumerate(instance)]
 
 
-def _ensure_type(instance: Any, expected: Any, path: Sequence[Any]) -> None:
-    expected_types = expected if isinstance(expected, (list, tuple)) else [expected]
+def _ensure_type(instance: Any, expected_types: List[Any], node: _PathNode) -> None:
     if not any(_matches_type(instance, schema_type) for schema_type in expected_types):
         readable = ", ".join(str(t) for t in expected_types)
-        raise SchemaValidationError(path, f"Expected type {readable}, got {_describe_type(instance)}")
+        raise SchemaValidationError(
+            _path(node), f"Expected type {readable}, got {_describe_type(instance)}"
+        )
+
+
+_TYPE_PREDICATES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, Mapping),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+# Exact JSON-decoded types; subclasses fall through to the isinstance checks.
+_TYPE_NAMES: Dict[type, str] = {
+    dict: "object",
+    list: "array",
+    tuple: "array",
+    str: "string",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    type(None): "null",
+}
 
 
 def _matches_type(instance: Any, schema_type: Any) -> bool:
-    if schema_type == "object":
-        return isinstance(instance, Mapping)
-    if schema_type == "array":
-        return isinstance(instance, (list, tuple))
-    if schema_type == "string":
-        return isinstance(instance, str)
-    if schema_type == "integer":
-        return isinstance(instance, int) and not isinstance(instance, bool)
-    if schema_type == "number":
-        return isinstance(instance, (int, float)) and not isinstance(instance, bool)
-    if schema_type == "boolean":
-        return isinstance(instance, bool)
-    if schema_type == "null":
-        return instance is None
-    return False
+    predicate = _TYPE_PREDICATES.get(schema_type) if isinstance(schema_type, str) else None
+    return predicate is not None and predicate(instance)
 
 
 def _describe_type(instance: Any) -> str:
+    name = _TYPE_NAMES.get(type(instance))
+    if name is not None:
+        return name
     if isinstance(instance, Mapping):
         return "object"
     if isinstance(instance, (list, tuple)):
@@ -155,20 +290,18 @@ def _describe_type(instance: Any) -> str:
         return "boolean"
     if isinstance(instance, (int, float)):
         return "number"
-    if instance is None:
-        return "null"
     return type(instance).__name__
 
 
-def _validate_format(value: str, format_type: str, path: Sequence[Any]) -> None:
+def _validate_format(value: str, format_type: str, node: _PathNode) -> None:
     if format_type == "date-time":
         try:
             # Support the "Z" suffix used in the sample configs.
             datetime.fromisoformat(value.replace("Z", "+00:00"))
         except ValueError as exc:  # pragma: no cover - defensive
-            raise SchemaValidationError(path, f"Invalid date-time format: {value!r}") from exc
+            raise SchemaValidationError(_path(node), f"Invalid date-time format: {value!r}") from exc
     elif format_type == "uri":
         parsed = urlparse(value)
         if not parsed.scheme or not parsed.netloc:
-            raise SchemaValidationError(path, f"Invalid URI: {value!r}")
+            raise SchemaValidationError(_path(node), f"Invalid URI: {value!r}")
     # Unknown formats are ignored – the schema does not rely on them.
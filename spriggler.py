@@ -14,6 +14,10 @@ import sys
 import time
 
 
+# Minimum level written by the log sinks configured in setup_logging().
+LOG_LEVEL = "INFO"
+
+
 class Spriggler:
     def __init__(self, config_path):
         self.config_path = config_path
@@ -30,6 +34,8 @@ class Spriggler:
         self.heartbeat_interval = 60.0
         self.environment_controller = None
         self._last_log_time = time.monotonic()
+        self._bound_loggers = {}  # (component_type, entity_name) -> bound logger
+        self._level_names = {}  # level as passed by callers -> upper-cased name
 
         self.setup_logging()
 
@@ -55,12 +61,12 @@ class Spriggler:
                     "retention": "7 days",
                     "compression": "zip",
                     "serialize": False,
-                    "level": "INFO",
+                    "level": LOG_LEVEL,
                 },
                 {
                     "sink": lambda msg: print(msg, end=""),
                     "format": log_format,
-                    "level": "INFO",
+                    "level": LOG_LEVEL,
                 },
             ],
             extra={"COMPONENT_TYPE": "system", "ENTITY_NAME": "global"},
@@ -70,7 +76,18 @@ class Spriggler:
         """Centralized logging function with documented fields."""
         if not isinstance(entity_name, str):
             entity_name = str(entity_name)
-        logger.bind(COMPONENT_TYPE=component_type, ENTITY_NAME=entity_name).log(level.upper(), message)
+
+        key = (component_type, entity_name)
+        bound_logger = self._bound_loggers.get(key)
+        if bound_logger is None:
+            bound_logger = logger.bind(COMPONENT_TYPE=component_type, ENTITY_NAME=entity_name)
+            self._bound_loggers[key] = bound_logger
+
+        level_name = self._level_names.get(level)
+        if level_name is None:
+            level_name = self._level_names[level] = level.upper()
+
+        bound_logger.log(level_name, message)
         self._last_log_time = time.monotonic()
 
     async def initialize_config(self):
@@ -191,6 +208,7 @@ class Spriggler:
             debounce_seconds=debounce_seconds,
             state_refresh_seconds=state_refresh_seconds,
             dry_run=dry_run,
+            min_log_level=LOG_LEVEL,
         )
 
     async def shutdown(self):
@@ -1,4 +1,7 @@
+import os
+
 import pytest
+import config_loader
 from config_loader import load_config, ConfigError
 
 def test_load_valid_config():
@@ -25,3 +28,64 @@ def test_partial_config():
     # Assuming `load_config` validates required keys
     with pytest.raises(ConfigError, match="Schema validation error at header: Missing required property"):
         load_config('config/partial.json')
+
+
+def test_schema_cached_between_loads(monkeypatch):
+    """Test that the schema file is only parsed once while unchanged."""
+    load_config('config/seedling.json')
+
+    def fail_read_bytes(*args, **kwargs):
+        raise AssertionError("Schema should be served from the cache")
+
+    monkeypatch.setattr(config_loader.Path, "read_bytes", fail_read_bytes)
+    assert isinstance(load_config('config/seedling.json'), dict)
+
+
+def test_cached_config_is_isolated_from_callers():
+    """Test that repeated loads return independent copies of the config."""
+    first = load_config('config/seedling.json')
+    first['header']['mutated'] = True
+
+    second = load_config('config/seedling.json')
+    assert 'mutated' not in second['header']
+
+
+def test_unchanged_config_skips_revalidation(monkeypatch):
+    """Test that reloading an unchanged config does not validate it again."""
+    load_config('config/seedling.json')
+
+    def fail_validate(*args, **kwargs):
+        raise AssertionError("Unchanged config should not be re-validated")
+
+    monkeypatch.setattr(config_loader, "validate_schema", fail_validate)
+    assert 'header' in load_config('config/seedling.json')
+
+
+def test_streamed_config_rejects_trailing_data(monkeypatch, tmp_path):
+    """Test that large configs with trailing data fail like small ones."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(config_loader, "_STREAM_PARSE_THRESHOLD", 0)
+    config_file = tmp_path / "trailing.json"
+    config_file.write_text('{"header": {}}\n}')
+
+    with pytest.raises(ConfigError, match=r"Invalid JSON in configuration file: .*line 2 column 1"):
+        load_config(str(config_file))
+
+
+def test_schema_change_revalidates_cached_config(monkeypatch, tmp_path):
+    """Test that editing the schema invalidates previously validated configs."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"header": {}}')
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"type": "object"}')
+    monkeypatch.setattr(config_loader, "_SCHEMA_PATH", schema_file)
+
+    assert load_config(str(config_file)) == {"header": {}}
+
+    schema_file.write_text('{"type": "object", "required": ["sensors"]}')
+    stat = schema_file.stat()
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    with pytest.raises(ConfigError, match="Missing required property"):
+        load_config(str(config_file))
+    assert config_loader._SCHEMA_CACHE[str(schema_file)][0] == schema_file.stat().st_mtime_ns
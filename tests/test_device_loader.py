@@ -88,3 +88,27 @@ def test_invalid_device_class(monkeypatch):
     devices = load_devices(device_definitions)
 
     assert len(devices) == 0
+
+def test_repeated_models_imported_once(monkeypatch):
+    """Definitions sharing a model resolve the module only once."""
+    from loaders import _entity_loader
+
+    imported = []
+
+    def mock_import_module(module_name):
+        imported.append(module_name)
+        mock_module = types.ModuleType(module_name)
+        mock_module.CountedDevice = MockDevice
+        return mock_module
+
+    monkeypatch.setattr(_entity_loader, "import_module", mock_import_module)
+    monkeypatch.setattr(_entity_loader, "_RESOLVED_CACHE", {})
+
+    device_definitions = [
+        {"id": f"device_{index}", "how": "counted_device"} for index in range(3)
+    ]
+
+    devices = load_devices(device_definitions)
+
+    assert [device.id for device in devices] == ["device_0", "device_1", "device_2"]
+    assert imported == ["devices.counted_device"]
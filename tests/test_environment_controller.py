@@ -1,7 +1,11 @@
 import asyncio
 import time
 
-from controllers.environment_controller import EnvironmentController
+from controllers.environment_controller import (
+    EnvironmentController,
+    _parse_time_range,
+    _time_in_range,
+)
 from devices.power_state import ensure_power_state
 
 
@@ -42,7 +46,7 @@ class TrackingDevice:
         )
 
 
-def build_controller():
+def build_controller(*, time_range=None, **kwargs):
     config = {
         "environments": {
             "definitions": [
@@ -59,7 +63,7 @@ def build_controller():
         },
         "schedules": {
             "definitions": [
-                {"id": "always", "time_range": None, "targets": {"power": "on"}}
+                {"id": "always", "time_range": time_range, "targets": {"power": "on"}}
             ]
         },
         "devices": {
@@ -83,7 +87,9 @@ def build_controller():
         },
     }
 
-    return EnvironmentController(config=config, debounce_seconds=0, state_refresh_seconds=0)
+    kwargs.setdefault("debounce_seconds", 0)
+    kwargs.setdefault("state_refresh_seconds", 0)
+    return EnvironmentController(config=config, **kwargs)
 
 
 def build_logging_controller(*, state_refresh_seconds: float = 1.0):
@@ -168,6 +174,29 @@ def test_issues_command_when_state_differs():
     assert device.turn_on_called is True
 
 
+def test_debug_messages_skipped_below_min_log_level():
+    for min_log_level, expected in (("DEBUG", 1), ("INFO", 0)):
+        logs = []
+
+        def log_callback(message, *, level, component_type, entity_name):
+            logs.append((level, message))
+
+        controller = build_controller(log_callback=log_callback, min_log_level=min_log_level)
+        device = TrackingDevice(initial_state=True)
+
+        asyncio.run(
+            controller._apply_state_targets(
+                environment_id="env1",
+                property_name="power",
+                desired_state="on",
+                controllers=["dev1"],
+                devices={"dev1": device},
+            )
+        )
+
+        assert len([log for log in logs if log[0] == "DEBUG"]) == expected
+
+
 def test_missing_readings_suppressed_until_cooldown():
     controller, logs = build_logging_controller(state_refresh_seconds=0.5)
 
@@ -198,3 +227,190 @@ def test_missing_readings_reset_after_data():
 
     missing_logs = [log for log in logs if "No readings available" in log["message"]]
     assert len(missing_logs) == 2
+
+
+def build_heater_controller(heater_ids=("heater",), debounce_seconds=0, **kwargs):
+    config = {
+        "environments": {
+            "definitions": [
+                {
+                    "id": "env1",
+                    "properties": {
+                        "temperature": {
+                            "controllers": list(heater_ids),
+                            "schedules": ["always"],
+                            "sensors": ["sensor1", "sensor2"],
+                        }
+                    },
+                }
+            ]
+        },
+        "schedules": {
+            "definitions": [
+                {
+                    "id": "always",
+                    "time_range": None,
+                    "targets": {"temperature": {"min": 20, "max": 25}},
+                }
+            ]
+        },
+        "devices": {
+            "definitions": [
+                {
+                    "id": heater_id,
+                    "what": "heater",
+                    "effects": [
+                        {
+                            "property": "humidity",
+                            "policy": {"increase": "off", "stable": "off", "decrease": "on"},
+                        },
+                        {
+                            "property": "temperature",
+                            "policy": {"increase": "on", "stable": "off", "decrease": "off"},
+                        },
+                    ],
+                }
+                for heater_id in heater_ids
+            ],
+            "defaults": {"effects": {}},
+        },
+    }
+
+    return EnvironmentController(
+        config=config, debounce_seconds=debounce_seconds, state_refresh_seconds=0, **kwargs
+    )
+
+
+def test_evaluate_applies_effect_for_property():
+    controller = build_heater_controller()
+    heater = TrackingDevice(initial_state=False)
+
+    asyncio.run(
+        controller.evaluate(
+            sensor_data={"sensor1": {"temperature": 18}, "sensor2": {"temperature": 19}},
+            devices={"heater": heater},
+        )
+    )
+
+    assert heater.turn_on_called is True
+    assert heater.turn_off_called is False
+
+
+def test_time_range_windows():
+    day = _parse_time_range("08:00-17:00")
+    overnight = _parse_time_range("22:00-06:00")
+
+    assert _time_in_range(day, 8 * 3600)
+    assert not _time_in_range(day, 17 * 3600 + 30)
+    assert _time_in_range(overnight, 23 * 3600)
+    assert _time_in_range(overnight, 5 * 3600)
+    assert not _time_in_range(overnight, 12 * 3600)
+    assert _parse_time_range("25:00-06:00") is None
+    assert not _time_in_range(_parse_time_range("bogus"), 0)
+
+
+def test_evaluate_dispatches_devices_concurrently():
+    controller = build_heater_controller(heater_ids=("heater", "heater2"))
+
+    started = []
+
+    class SlowDevice:
+        def __init__(self, device_id):
+            self.id = device_id
+
+        async def turn_on(self):
+            started.append(self.id)
+            # Only completes if the other device's command starts meanwhile.
+            while len(started) < 2:
+                await asyncio.sleep(0)
+            return None
+
+    async def run():
+        await asyncio.wait_for(
+            controller.evaluate(
+                sensor_data={"sensor1": {"temperature": 18}},
+                devices={"heater": SlowDevice("heater"), "heater2": SlowDevice("heater2")},
+            ),
+            timeout=1,
+        )
+
+    asyncio.run(run())
+
+    assert sorted(started) == ["heater", "heater2"]
+
+
+def test_unchanged_readings_skip_evaluation_within_debounce(monkeypatch):
+    controller = build_heater_controller(debounce_seconds=60)
+    heater = TrackingDevice(initial_state=False)
+    devices = {"heater": heater}
+
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+    assert heater.turn_on_called is True
+
+    def fail_issue_command(self, **kwargs):
+        raise AssertionError("Unchanged readings should skip the pass")
+
+    monkeypatch.setattr(EnvironmentController, "_issue_command", fail_issue_command)
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+
+
+def test_unrecorded_command_is_retried_on_next_tick():
+    controller = build_heater_controller(debounce_seconds=60)
+    heater = TrackingDevice(initial_state=True)
+    devices = {"heater": heater}
+
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+    heater.is_on_state = False
+
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+    assert heater.turn_on_called is True
+
+
+def test_failed_command_is_retried_on_next_tick():
+    controller = build_heater_controller(debounce_seconds=60)
+    attempts = []
+
+    class FlakyHeater:
+        async def turn_on(self):
+            attempts.append("turn_on")
+            if len(attempts) == 1:
+                raise ConnectionError("unreachable")
+
+    devices = {"heater": FlakyHeater()}
+    for _ in range(3):
+        asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+
+    assert attempts == ["turn_on", "turn_on"]
+
+
+def test_active_schedule_follows_window_boundaries():
+    controller = build_controller(time_range="08:00-17:00")
+
+    controller._refresh_active_schedules(17 * 3600)
+    assert controller._active_schedules[0] is not None
+
+    controller._refresh_active_schedules(17 * 3600 + 1)
+    assert controller._active_schedules == [None]
+
+    controller._refresh_active_schedules(8 * 3600)
+    assert controller._active_schedules[0] is not None
+
+
+def test_repeat_commands_not_queued_inside_quiet_window(monkeypatch):
+    controller = build_heater_controller(debounce_seconds=60, min_log_level="INFO")
+    heater = TrackingDevice(initial_state=False)
+    devices = {"heater": heater}
+    issued = []
+    issue_command = EnvironmentController._issue_command
+
+    def counting_issue_command(self, **kwargs):
+        issued.append(kwargs["command"])
+        return issue_command(self, **kwargs)
+
+    monkeypatch.setattr(EnvironmentController, "_issue_command", counting_issue_command)
+
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 15}}, devices=devices))
+    asyncio.run(controller.evaluate(sensor_data={"sensor1": {"temperature": 16}}, devices=devices))
+
+    assert heater.turn_on_called is True
+    assert issued == ["turn_on"]
@@ -16,9 +16,24 @@ sys.modules.setdefault("kasa", dummy_kasa)
 from devices import KASA_Powerbar as kasa_module  # noqa: E402
 
 
+def _clear_class_caches():
+    for cache in (
+        kasa_module.KasaPowerbar._device_cache,
+        kasa_module.KasaPowerbar._outlet_index,
+        kasa_module.KasaPowerbar._pending_updates,
+        kasa_module.KasaPowerbar._strip_refreshed_at,
+        kasa_module.KasaPowerbar._strip_switched_at,
+        kasa_module.KasaPowerbar._discovered_hosts,
+        kasa_module.KasaPowerbar._locks,
+    ):
+        cache.clear()
+
+
 @pytest.fixture(autouse=True)
-def clear_kasa_cache():
-    kasa_module.KasaPowerbar._device_cache.clear()
+def reset_kasa_cache():
+    _clear_class_caches()
+    yield
+    _clear_class_caches()
 
 
 class DummyOutlet:
@@ -113,15 +128,9 @@ class DummyStrip:
 
 
 class DummyDiscoveredDevice:
-    def __init__(self, alias):
+    def __init__(self, alias, host=None):
         self.alias = alias
-
-
-@pytest.fixture(autouse=True)
-def reset_kasa_cache():
-    kasa_module.KasaPowerbar._device_cache.clear()
-    yield
-    kasa_module.KasaPowerbar._device_cache.clear()
+        self.host = host
 
 
 def test_initialize_with_discovery(monkeypatch):
@@ -134,7 +143,7 @@ def test_initialize_with_discovery(monkeypatch):
         created_instances.append(strip)
         return strip
 
-    async def mock_discover():
+    async def mock_discover(**kwargs):
         await asyncio.sleep(0)
         return {"192.168.1.55": DummyDiscoveredDevice("Seedling Strip")}
 
@@ -174,7 +183,7 @@ def test_initialize_with_static_ip(monkeypatch):
         created_instances.append(strip)
         return strip
 
-    async def fail_discovery():  # pragma: no cover - ensures discovery is not invoked
+    async def fail_discovery(**kwargs):  # pragma: no cover - ensures discovery is not invoked
         raise AssertionError("Discovery should not run when ip_address is provided")
 
     monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
@@ -203,7 +212,7 @@ def test_missing_outlet_raises(monkeypatch):
     async def mock_discover_single(host, port=9999):
         return DummyStrip(host=host, port=port, outlets=[DummyOutlet("Other")])
 
-    async def mock_discover():
+    async def mock_discover(**kwargs):
         await asyncio.sleep(0)
         return {"192.168.1.20": DummyDiscoveredDevice("Seedling Strip")}
 
@@ -235,7 +244,7 @@ def test_reuses_cached_strip(monkeypatch):
         created_instances.append(strip)
         return strip
 
-    async def mock_discover():
+    async def mock_discover(**kwargs):
         await asyncio.sleep(0)
         return {"192.168.1.55": DummyDiscoveredDevice("Seedling Strip")}
 
@@ -404,3 +413,203 @@ def test_countdown_module_supports_count_down(monkeypatch):
         ("count_down", "add_rule", {"act": 0, "delay": 6, "enable": 1, "name": "spriggler_failsafe"}),
     ]
     assert outlet.countdown_module.delete_all_calls == 1
+
+
+def test_concurrent_state_reads_share_one_strip_update(monkeypatch):
+    heater_outlet = DummyOutlet("Heater")
+    light_outlet = DummyOutlet("Lights")
+    strip = DummyStrip(host="192.168.1.60", outlets=[heater_outlet, light_outlet])
+
+    async def mock_discover_single(host):
+        return strip
+
+    monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
+
+    devices = [
+        kasa_module.KasaPowerbar(
+            {"id": outlet, "control": {"ip_address": "192.168.1.60", "outlet_name": outlet}}
+        )
+        for outlet in ("Heater", "Lights")
+    ]
+
+    async def read_states():
+        for device in devices:
+            await device.initialize()
+        return await asyncio.gather(*(device.is_on() for device in devices))
+
+    assert asyncio.run(read_states()) == [False, False]
+    assert strip.update_calls == 2  # one during initialize, one shared by both reads
+
+
+def test_discovery_returns_on_first_matching_strip(monkeypatch):
+    discovery_cancelled = []
+
+    async def mock_discover(*, on_discovered=None, **kwargs):
+        await on_discovered(DummyDiscoveredDevice("Other Strip", host="192.168.1.40"))
+        await on_discovered(DummyDiscoveredDevice("Seedling Strip", host="192.168.1.41"))
+        try:
+            await asyncio.sleep(3600)  # rest of the discovery window
+        except asyncio.CancelledError:
+            discovery_cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(kasa_module.Discover, "discover", mock_discover)
+
+    device = kasa_module.KasaPowerbar(
+        {"id": "heater", "control": {"name": "seedling strip", "outlet_name": "Heater"}}
+    )
+
+    async def discover_and_settle():
+        host = await device._discover_host()  # noqa: SLF001 - exercising discovery directly
+        await asyncio.sleep(0)
+        return host
+
+    assert asyncio.run(discover_and_settle()) == "192.168.1.41"
+    assert discovery_cancelled == [True]
+
+
+def test_name_discovery_shared_across_outlets(monkeypatch):
+    strip = DummyStrip(host="192.168.1.55", outlets=[DummyOutlet("Heater"), DummyOutlet("Lights")])
+    discover_calls = []
+
+    async def mock_discover_single(host):
+        return strip
+
+    async def mock_discover(**kwargs):
+        discover_calls.append(kwargs)
+        await asyncio.sleep(0)
+        return {"192.168.1.55": DummyDiscoveredDevice("Seedling Strip")}
+
+    monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
+    monkeypatch.setattr(kasa_module.Discover, "discover", mock_discover)
+
+    devices = [
+        kasa_module.KasaPowerbar(
+            {"id": outlet, "control": {"name": "Seedling Strip", "outlet_name": outlet}}
+        )
+        for outlet in ("Heater", "Lights")
+    ]
+
+    async def initialize_all():
+        await asyncio.gather(*(device.initialize() for device in devices))
+
+    asyncio.run(initialize_all())
+
+    assert len(discover_calls) == 1
+    assert [device.address for device in devices] == ["192.168.1.55", "192.168.1.55"]
+
+
+def test_concurrent_initialize_connects_to_strip_once(monkeypatch):
+    created_instances = []
+
+    async def mock_discover_single(host):
+        await asyncio.sleep(0)
+        strip = DummyStrip(host=host, outlets=[DummyOutlet("Heater"), DummyOutlet("Lights")])
+        created_instances.append(strip)
+        return strip
+
+    monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
+
+    devices = [
+        kasa_module.KasaPowerbar(
+            {"id": outlet, "control": {"ip_address": "192.168.1.62", "outlet_name": outlet}}
+        )
+        for outlet in ("Heater", "Lights")
+    ]
+
+    async def initialize_all():
+        await asyncio.gather(*(device.initialize() for device in devices))
+
+    asyncio.run(initialize_all())
+
+    assert len(created_instances) == 1
+    assert created_instances[0].update_calls == 1
+    assert devices[0]._device is devices[1]._device  # noqa: SLF001 - intentional cache check
+
+
+def test_state_reads_reuse_recent_strip_update(monkeypatch):
+    outlet = DummyOutlet("Heater")
+    strip = DummyStrip(host="192.168.1.61", outlets=[outlet])
+
+    async def mock_discover_single(host):
+        return strip
+
+    monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
+
+    device = kasa_module.KasaPowerbar(
+        {"id": "heater", "control": {"ip_address": "192.168.1.61", "outlet_name": "Heater"}}
+    )
+
+    async def exercise():
+        await device.initialize()
+        await device.is_on()
+        await device.is_on()
+        refreshes_before_command = strip.update_calls
+        await device.turn_on()
+        await device.is_on()
+        return refreshes_before_command
+
+    assert asyncio.run(exercise()) == 2  # initialize + first read; second read reused it
+    assert strip.update_calls == 3  # the command invalidated the cached state
+
+
+def test_refresh_started_during_command_is_not_reused(monkeypatch):
+    heater_outlet = DummyOutlet("Heater")
+    fan_outlet = DummyOutlet("Fan")
+    strip = DummyStrip(host="192.168.1.62", outlets=[heater_outlet, fan_outlet])
+
+    async def mock_discover_single(host):
+        return strip
+
+    monkeypatch.setattr(kasa_module.Discover, "discover_single", mock_discover_single)
+
+    heater = kasa_module.KasaPowerbar(
+        {"id": "heater", "control": {"ip_address": "192.168.1.62", "outlet_name": "Heater"}}
+    )
+    fan = kasa_module.KasaPowerbar(
+        {"id": "fan", "control": {"ip_address": "192.168.1.62", "outlet_name": "Fan"}}
+    )
+
+    async def exercise():
+        await heater.initialize()
+        await fan.initialize()
+
+        switching = asyncio.Event()
+        switch_gate = asyncio.Event()
+        refresh_gate = asyncio.Event()
+        original_turn_on = heater_outlet.turn_on
+        original_update = strip.update
+
+        async def slow_turn_on():
+            switching.set()
+            await switch_gate.wait()
+            await original_turn_on()
+
+        async def slow_update():
+            await refresh_gate.wait()
+            await original_update()
+
+        heater_outlet.turn_on = slow_turn_on
+        command = asyncio.ensure_future(heater.turn_on())
+        await switching.wait()
+
+        # The sibling's refresh starts while the heater relay is switching...
+        kasa_module.KasaPowerbar._strip_refreshed_at.clear()
+        strip.update = slow_update
+        sibling_read = asyncio.ensure_future(fan.is_on())
+        await asyncio.sleep(0)
+
+        # ...and only completes after the command has finished.
+        switch_gate.set()
+        await command
+        refresh_gate.set()
+        await sibling_read
+
+        strip.update = original_update
+        refreshes_before_read = strip.update_calls
+        assert await heater.is_on() is True
+        return refreshes_before_read
+
+    refreshes_before_read = asyncio.run(exercise())
+
+    assert strip.update_calls == refreshes_before_read + 1
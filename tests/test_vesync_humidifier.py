@@ -0,0 +1,287 @@
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+dummy_pyvesync = types.ModuleType("pyvesync")
+dummy_pyvesync.VeSync = object
+sys.modules.setdefault("pyvesync", dummy_pyvesync)
+
+from devices import vesync_humidifier as vesync_module  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_manager_cache():
+    vesync_module._MANAGER_CACHE.clear()
+    vesync_module._MANAGER_UPDATED_AT.clear()
+    vesync_module._DEVICE_CACHE.clear()
+
+
+class DummyHumidifier:
+    def __init__(self, name="Bedroom Humidifier", status="off"):
+        self.device_name = name
+        self.device_type = "LUH-D301S"
+        self.uuid = f"uuid-{name}"
+        self.cid = f"cid-{name}"
+        self.device_status = status
+        self.update_calls = 0
+        self.commands = []
+
+    def update(self):
+        self.update_calls += 1
+
+    def turn_on(self):
+        self.commands.append("on")
+        self.device_status = "on"
+
+    def turn_off(self):
+        self.commands.append("off")
+        self.device_status = "off"
+
+
+class DummyManager:
+    def __init__(self, devices):
+        self.humidifiers = list(devices)
+        self.login_calls = 0
+        self.update_calls = 0
+        # pyvesync reports network and credential failures alike by returning False.
+        self.login_failures = 0
+
+    def login(self):
+        self.login_calls += 1
+        return self.login_calls > self.login_failures
+
+    def update(self):
+        self.update_calls += 1
+
+
+def build_humidifier(
+    monkeypatch, devices, *, name="Bedroom Humidifier", manager=None, password="secret", **control
+):
+    manager = manager or DummyManager(devices)
+    monkeypatch.setattr(vesync_module, "VeSync", lambda *args, **kwargs: manager)
+    humidifier = vesync_module.VesyncHumidifier(
+        {
+            "id": "humidifier",
+            "control": {
+                "name": name,
+                "email": "grower@example.com",
+                "password": password,
+                **control,
+            },
+        }
+    )
+    return humidifier, manager
+
+
+def test_status_reads_reuse_recent_update(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, _ = build_humidifier(monkeypatch, [device], status_ttl=60)
+
+    async def scenario():
+        await humidifier.initialize()
+        first = await humidifier.is_on()
+        second = await humidifier.is_on()
+        return first, second
+
+    assert asyncio.run(scenario()) == (False, False)
+    assert device.update_calls == 1
+
+
+def test_commands_invalidate_cached_status(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, _ = build_humidifier(monkeypatch, [device], status_ttl=60)
+
+    async def scenario():
+        await humidifier.initialize()
+        await humidifier.turn_on()
+        return await humidifier.is_on()
+
+    assert asyncio.run(scenario()) is True
+    assert device.commands == ["on"]
+    assert device.update_calls == 2
+
+
+def test_commands_skip_pre_read_when_status_is_fresh(monkeypatch):
+    device = DummyHumidifier(status="on")
+    humidifier, _ = build_humidifier(monkeypatch, [device], status_ttl=60)
+
+    async def scenario():
+        await humidifier.initialize()
+        await humidifier.is_on()
+        updates_before_command = device.update_calls
+        result = await humidifier.turn_on()
+        return result, updates_before_command
+
+    result, updates_before_command = asyncio.run(scenario())
+
+    assert result.command_sent is False
+    assert device.commands == []
+    assert device.update_calls == updates_before_command == 1
+
+
+def test_humidifiers_share_account_session(monkeypatch):
+    bedroom = DummyHumidifier("Bedroom Humidifier")
+    tent = DummyHumidifier("Tent Humidifier")
+    manager = DummyManager([bedroom, tent])
+    first, _ = build_humidifier(monkeypatch, [], manager=manager)
+    second, _ = build_humidifier(monkeypatch, [], name="Tent Humidifier", manager=manager)
+
+    async def scenario():
+        await asyncio.gather(first.initialize(), second.initialize())
+
+    asyncio.run(scenario())
+
+    assert manager.login_calls == 1
+    assert manager.update_calls == 1
+    assert first._device is bedroom
+    assert second._device is tent
+
+
+def test_different_password_does_not_reuse_session(monkeypatch):
+    manager = DummyManager([DummyHumidifier()])
+    first, _ = build_humidifier(monkeypatch, [], manager=manager)
+    second, _ = build_humidifier(monkeypatch, [], manager=manager, password="wrong")
+
+    async def scenario():
+        await first.initialize()
+        await second.initialize()
+
+    asyncio.run(scenario())
+
+    assert manager.login_calls == 2
+    assert len(vesync_module._MANAGER_CACHE) == 2
+
+
+def test_login_retries_with_backoff(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, manager = build_humidifier(monkeypatch, [device])
+    manager.login_failures = 2
+    sleeps = []
+    monkeypatch.setattr(vesync_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(vesync_module.random, "uniform", lambda low, high: 0.0)
+
+    asyncio.run(humidifier.initialize())
+
+    assert manager.login_calls == 3
+    assert sleeps == [1.0, 2.0]
+    assert humidifier._device is device
+
+
+def test_login_gives_up_after_max_attempts(monkeypatch):
+    humidifier, manager = build_humidifier(monkeypatch, [DummyHumidifier()])
+    manager.login_failures = vesync_module.CLOUD_MAX_ATTEMPTS
+    sleeps = []
+    monkeypatch.setattr(vesync_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(vesync_module.random, "uniform", lambda low, high: 0.0)
+
+    with pytest.raises(RuntimeError, match="login failed"):
+        asyncio.run(humidifier.initialize())
+
+    assert manager.login_calls == vesync_module.CLOUD_MAX_ATTEMPTS
+    assert sleeps == [1.0, 2.0, 4.0, 8.0]
+    assert vesync_module._MANAGER_CACHE == {}
+
+
+def test_reinitialize_rebinds_refreshed_handle(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, manager = build_humidifier(monkeypatch, [device])
+    monkeypatch.setattr(vesync_module, "MANAGER_UPDATE_TTL_SECONDS", 0)
+    refreshed = DummyHumidifier()
+
+    asyncio.run(humidifier.initialize())
+    manager.humidifiers = [refreshed]
+    asyncio.run(humidifier.initialize())
+
+    assert manager.update_calls == 2
+    assert humidifier._device is refreshed
+
+
+def test_reinitialize_rejects_device_no_longer_reported(monkeypatch):
+    humidifier, manager = build_humidifier(monkeypatch, [DummyHumidifier()])
+    monkeypatch.setattr(vesync_module, "MANAGER_UPDATE_TTL_SECONDS", 0)
+
+    asyncio.run(humidifier.initialize())
+    manager.humidifiers = [DummyHumidifier("Tent Humidifier")]
+
+    with pytest.raises(ValueError, match="was not found"):
+        asyncio.run(humidifier.initialize())
+
+
+def test_stale_status_command_uses_one_thread_hop(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, _ = build_humidifier(monkeypatch, [device], status_ttl=0)
+    asyncio.run(humidifier.initialize())
+
+    real_run_blocking = vesync_module._run_blocking
+    hops = []
+
+    async def counting_run_blocking(func, *args):
+        hops.append(func)
+        return await real_run_blocking(func, *args)
+
+    monkeypatch.setattr(vesync_module, "_run_blocking", counting_run_blocking)
+
+    result = asyncio.run(humidifier.turn_on())
+
+    assert result.command_sent is True
+    assert device.commands == ["on"]
+    assert device.update_calls == 1
+    assert len(hops) == 1
+
+
+def test_concurrent_initialize_runs_once(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, manager = build_humidifier(monkeypatch, [device])
+
+    real_run_blocking = vesync_module._run_blocking
+    hops = []
+
+    async def counting_run_blocking(func, *args):
+        hops.append(func)
+        return await real_run_blocking(func, *args)
+
+    monkeypatch.setattr(vesync_module, "_run_blocking", counting_run_blocking)
+
+    async def scenario():
+        await asyncio.gather(humidifier.initialize(), humidifier.initialize())
+
+    asyncio.run(scenario())
+
+    assert len(hops) == 1
+    assert manager.login_calls == 1
+    assert humidifier._device is device
+
+
+def test_categorised_humidifier_selected_before_full_scan(monkeypatch):
+    mister = DummyHumidifier("Tent Mister")
+    manager = DummyManager([mister])
+    manager.fans = [DummyHumidifier("Humidity Fan")]
+    humidifier, _ = build_humidifier(monkeypatch, [], name="Tent Mister", manager=manager)
+
+    asyncio.run(humidifier.initialize())
+
+    assert humidifier._device is mister
+
+
+def test_command_jitter_delays_before_command(monkeypatch):
+    device = DummyHumidifier()
+    humidifier, _ = build_humidifier(monkeypatch, [device], command_jitter=0.5)
+    asyncio.run(humidifier.initialize())
+
+    delays = []
+
+    async def record_sleep(delay):
+        delays.append((delay, list(device.commands)))
+
+    monkeypatch.setattr(vesync_module.random, "uniform", lambda low, high: high / 2)
+    monkeypatch.setattr(vesync_module.asyncio, "sleep", record_sleep)
+
+    asyncio.run(humidifier.turn_on())
+
+    assert delays == [(0.25, [])]
+    assert device.commands == ["on"]